@@ -1,10 +1,17 @@
 #!/usr/bin/env python3
-"""Interactive campaign brief builder with guided input."""
+"""Campaign brief builder: interactive wizard or batched template mode."""
 
+import argparse
 import json
 import sys
 from pathlib import Path
 
+# Fast native JSON dump when available (see src.utils for the same pattern)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def prompt_with_hint(question: str, hint: str, default: str = None) -> str:
     """Prompt user with helpful hint."""
@@ -31,8 +38,30 @@ def prompt_list(question: str, hint: str, min_items: int = 1) -> list:
         print(f"❌ Please enter at least {min_items} item(s).")
 
 
-def create_product() -> dict:
-    """Create a product interactively."""
+def create_product(defaults: dict = None) -> dict:
+    """Create a product interactively, or from a template dict in batch mode."""
+    if defaults is not None:
+        creative = defaults.get('creative_brief', {})
+        brand = defaults.get('brand_style', {})
+        return {
+            "id": defaults.get('id'),
+            "name": defaults.get('name', "Premium Product"),
+            "description": defaults.get('description', "High-quality product with natural ingredients"),
+            "category": defaults.get('category', "personal_care"),
+            "creative_brief": {
+                "setting": creative.get('setting', "Clean studio environment"),
+                "mood": creative.get('mood', "Fresh and clean"),
+                # Non-empty fallbacks: the models require at least one
+                # visual element and one color, so templates may omit them
+                "key_visual_elements": creative.get('key_visual_elements') or ["Product shot"],
+            },
+            "brand_style": {
+                "color_palette": brand.get('color_palette') or ["#FFFFFF"],
+                "visual_style": brand.get('visual_style', "Clean and modern"),
+                "photography_style": brand.get('photography_style', "Commercial product photography")
+            }
+        }
+
     print("\n" + "="*60)
     print("PRODUCT CONFIGURATION")
     print("="*60)
@@ -124,8 +153,18 @@ def create_product() -> dict:
     }
 
 
-def create_campaign_brief() -> dict:
-    """Create a complete campaign brief interactively."""
+def create_campaign_brief(defaults: dict = None) -> dict:
+    """Create a complete campaign brief interactively or from a template dict."""
+    if defaults is not None:
+        return {
+            "campaign_id": defaults.get('campaign_id', "my_campaign_2025"),
+            "region": defaults.get('region', "EMEA"),
+            "target_audience": defaults.get('target_audience', "millennials_25-35"),
+            "campaign_message": defaults.get('campaign_message', "Experience Excellence"),
+            "locales": defaults.get('locales', ["en"]),
+            "products": [create_product(p) for p in defaults.get('products', [])]
+        }
+
     print("\n" + "="*60)
     print("🎨 PRISM - Interactive Campaign Builder")
     print("="*60)
@@ -189,19 +228,74 @@ def create_campaign_brief() -> dict:
     }
 
 
+def write_brief(brief: dict) -> Path:
+    """Validate and write one brief to {campaign_id}_brief.json."""
+    # Pydantic catches template errors upfront, before any file is written
+    from src.models import CampaignBrief
+    CampaignBrief(**brief)
+
+    output_path = Path(f"{brief['campaign_id']}_brief.json")
+    if orjson is not None:
+        output_path.write_bytes(orjson.dumps(brief, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_path, 'w') as f:
+            json.dump(brief, f, indent=2)
+    return output_path
+
+
+def run_batch(batch_file: str, parallel: bool = False) -> int:
+    """Generate briefs from a YAML/JSON template without interactive prompts.
+
+    The template is either a single campaign dict or a list of them; missing
+    fields fall back to the same defaults the wizard offers.
+    """
+    batch_path = Path(batch_file)
+    if batch_path.suffix in ('.yaml', '.yml'):
+        import yaml
+        templates = yaml.safe_load(batch_path.read_text())
+    else:
+        templates = json.loads(batch_path.read_text())
+
+    if isinstance(templates, dict):
+        templates = [templates]
+
+    briefs = [create_campaign_brief(defaults=template) for template in templates]
+
+    if parallel and len(briefs) > 1:
+        # Writes are I/O-bound, so threads suffice — no pickling or fork cost
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            paths = list(executor.map(write_brief, briefs))
+    else:
+        paths = [write_brief(brief) for brief in briefs]
+
+    print("\n" + "="*60)
+    print(f"✅ {len(paths)} CAMPAIGN BRIEF(S) CREATED")
+    print("="*60)
+    for path in paths:
+        print(f"  {path}")
+    print("="*60)
+    return 0
+
+
 def main():
     """Main entry point."""
+    parser = argparse.ArgumentParser(description="Create Prism campaign briefs")
+    parser.add_argument('--batch', metavar='FILE', help="YAML/JSON template with one or more campaigns (non-interactive)")
+    parser.add_argument('--parallel', action='store_true', help="Write batch briefs concurrently")
+    args = parser.parse_args()
+
     try:
+        if args.batch:
+            return run_batch(args.batch, parallel=args.parallel)
+
         # Create campaign brief
         brief = create_campaign_brief()
-        
+
         # Save to file
-        filename = f"{brief['campaign_id']}_brief.json"
-        output_path = Path(filename)
-        
-        with open(output_path, 'w') as f:
-            json.dump(brief, f, indent=2)
-        
+        output_path = write_brief(brief)
+        filename = output_path.name
+
         print("\n" + "="*60)
         print("✅ CAMPAIGN BRIEF CREATED SUCCESSFULLY")
         print("="*60)
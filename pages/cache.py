@@ -0,0 +1,166 @@
+"""Cache management page - view stats and clear cache."""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import streamlit as st
+
+from ui import reports
+
+
+def _safe_unlink(f: Path) -> int:
+    """Delete a file, returning 1 on success and 0 on failure."""
+    try:
+        f.unlink()
+        return 1
+    except Exception:
+        return 0
+
+
+def _delete_files(files) -> int:
+    """Delete files concurrently; unlink is syscall-latency bound."""
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        return sum(executor.map(_safe_unlink, files))
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _scan_cache(cache_mtime: float):
+    """Scan the cache directory once and return (path, size, mtime) tuples.
+
+    Keyed on the directory mtime so any add/delete invalidates the entry;
+    the TTL bounds staleness for in-place file changes.
+    """
+    stats = []
+    # iterdir + suffix compare avoids fnmatch on every entry
+    for f in Path("cache").iterdir():
+        if f.suffix not in ('.png', '.webp'):
+            continue
+        s = f.stat()
+        stats.append((f, s.st_size, s.st_mtime))
+    return stats
+
+
+def cache_page():
+    """Cache management page - view stats and clear cache."""
+    st.header("💾 Cache Management")
+    st.markdown("View cache statistics and manage cached assets.")
+
+    cache_dir = Path("cache")
+    cache_dir.mkdir(exist_ok=True)
+
+    cache_stats = _scan_cache(cache_dir.stat().st_mtime)
+    cache_files = [f for f, _, _ in cache_stats]
+
+    # Statistics
+    st.subheader("📈 Cache Statistics")
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        st.metric("Cached Assets", len(cache_stats))
+
+    with col2:
+        if cache_stats:
+            size_mb = sum(size for _, size, _ in cache_stats) / 1024 / 1024
+            st.metric("Cache Size", f"{size_mb:.1f} MB")
+        else:
+            st.metric("Cache Size", "0 MB")
+
+    with col3:
+        avg_hit_rate = reports.calculate_avg_cache_hit_rate_cached(reports.logs_mtime())
+        st.metric("Avg Hit Rate", f"{avg_hit_rate:.0f}%")
+
+    st.markdown("---")
+
+    # Cache contents — built only when the user opens the panel, since a
+    # collapsed expander still evaluates its body on every rerun
+    if cache_stats:
+        if st.checkbox("📋 Show cache contents", value=False):
+            import pyarrow as pa
+
+            rows = sorted(cache_stats, key=lambda x: x[2], reverse=True)
+            table = pa.table({
+                "File": [f.name for f, _, _ in rows],
+                "Size": [size / 1024 for _, size, _ in rows],
+                "Modified": pa.array([int(mtime) for _, _, mtime in rows], type=pa.timestamp('s'))
+            })
+            st.dataframe(
+                table,
+                use_container_width=True,
+                hide_index=True,
+                column_config={
+                    "Size": st.column_config.NumberColumn("Size", format="%.1f KB"),
+                    "Modified": st.column_config.DatetimeColumn("Modified", format="YYYY-MM-DD HH:mm:ss")
+                }
+            )
+    else:
+        st.info("🗂️ Cache is empty")
+
+    # Actions
+    st.markdown("---")
+    st.subheader("🧹 Cache Actions")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("**Clear All Cache**")
+        st.caption("Delete all cached assets to free up space")
+
+        if st.button("🗑️ Clear All Cache", type="secondary", use_container_width=True, disabled=len(cache_files) == 0):
+            with st.form("confirm_clear_all"):
+                st.warning(f"⚠️ This will delete {len(cache_files)} cached assets")
+                confirm = st.checkbox("I understand this action cannot be undone")
+
+                if st.form_submit_button("Confirm Delete", type="primary"):
+                    if confirm:
+                        deleted_count = _delete_files(cache_files)
+                        _scan_cache.clear()
+                        st.success(f"✓ Deleted {deleted_count} cached assets")
+                        st.rerun()
+                    else:
+                        st.error("Please check the confirmation box")
+
+    with col2:
+        st.markdown("**Clear Old Cache**")
+        st.caption("Delete cache older than 30 days")
+
+        import time
+        old_files = [
+            f for f, _, mtime in cache_stats
+            if (time.time() - mtime) > 30 * 24 * 3600
+        ]
+
+        if st.button(
+            f"🧹 Clear Old Cache ({len(old_files)} files)",
+            type="secondary",
+            use_container_width=True,
+            disabled=len(old_files) == 0
+        ):
+            deleted_count = _delete_files(old_files)
+            _scan_cache.clear()
+            st.success(f"✓ Deleted {deleted_count} old cached assets")
+            st.rerun()
+
+    # Cache explanation
+    st.markdown("---")
+    with st.expander("ℹ️ How Caching Works"):
+        st.markdown("""
+        **Prism caches generated assets to reduce costs and improve performance:**
+
+        - When generating heroes, Prism checks if a similar hero was created before
+        - Cache key is based on: product ID, campaign message, and region
+        - If found in cache, reuses the hero instead of generating a new one
+        - Hero cache rate shows how often heroes are reused
+
+        **Benefits:**
+        - 💰 **Cost efficient**: Reuse heroes across campaigns
+        - ⚡ **Faster execution**: Cached heroes load instantly
+        - 🌍 **Consistency**: Same inputs produce same outputs
+
+        **When to clear cache:**
+        - Running low on disk space
+        - Want to regenerate assets with updated prompts
+        - Cache files are corrupted
+        """)
+
+
+cache_page()
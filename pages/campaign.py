@@ -0,0 +1,504 @@
+"""Campaign page - upload brief, assets, and run pipeline."""
+
+import os
+import re
+import json
+import hashlib
+
+import streamlit as st
+
+# Comma-separated form fields (locales, colors, visual elements) parse
+# through one compiled regex pass instead of split + per-item strip
+_CSV = re.compile(r'\s*,\s*')
+
+
+def _csv(s: str) -> list:
+    """Split a comma-separated field, trimming whitespace and empties."""
+    s = s.strip()
+    return [item for item in _CSV.split(s) if item] if s else []
+
+from ui import gallery, uploader, reports
+from ui.common import api_key_present, thumbnail_bytes
+
+# CampaignBrief, CampaignPipeline, and Config are imported lazily at their
+# use sites: src.pipeline drags in openai/PIL/numpy, which would otherwise
+# be paid on first paint before the user even submits a brief.
+
+
+@st.fragment
+def manual_campaign_form():
+    """Interactive form to create campaign brief manually."""
+    st.markdown("### Create Campaign Brief")
+    st.markdown("Fill in the form below to create your campaign. Hover over ℹ️ for hints.")
+
+    # Number of products OUTSIDE the form so it can update dynamically
+    st.subheader("📦 Products Configuration")
+    num_products = st.number_input(
+        "Number of Products",
+        min_value=2,
+        max_value=5,
+        value=2,
+        help="Select how many products to configure (2-5)"
+    )
+    st.caption(f"You'll configure {num_products} product(s) below")
+    st.markdown("---")
+
+    with st.form("manual_campaign_form"):
+        # Campaign basics
+        st.subheader("📋 Campaign Information")
+
+        col1, col2 = st.columns(2)
+        with col1:
+            campaign_id = st.text_input(
+                "Campaign ID*",
+                value="",
+                placeholder="e.g., summer_2025_launch",
+                help="Filesystem-safe ID (lowercase, underscores only)"
+            )
+
+        with col2:
+            region = st.selectbox(
+                "Region*",
+                ["EMEA", "NA", "APAC", "LATAM", "GLOBAL"],
+                help="Target market region"
+            )
+
+        target_audience = st.text_input(
+            "Target Audience*",
+            placeholder="e.g., millennials_25-35",
+            help="Primary demographic target"
+        )
+
+        campaign_message = st.text_input(
+            "Campaign Message*",
+            placeholder="e.g., Discover Summer Freshness",
+            help="Main tagline or headline (5-200 characters)",
+            max_chars=200
+        )
+
+        locales_input = st.text_input(
+            "Locales*",
+            value="en",
+            placeholder="en, fr, de",
+            help="Comma-separated language codes (e.g., en, fr, de)"
+        )
+
+        st.markdown("---")
+
+        # Products section
+        st.subheader(f"📦 Product Details ({num_products} products)")
+        st.caption("Fill in details for each product")
+
+        products = []
+        for i in range(num_products):
+            with st.expander(f"Product {i+1}", expanded=i<2):
+                col1, col2 = st.columns(2)
+
+                with col1:
+                    prod_id = st.text_input(
+                        "Product ID*",
+                        key=f"prod_id_{i}",
+                        placeholder="e.g., shampoo_citrus_500ml",
+                        help="Filesystem-safe (lowercase, underscores)"
+                    )
+
+                    prod_name = st.text_input(
+                        "Product Name*",
+                        key=f"prod_name_{i}",
+                        placeholder="e.g., CitriFresh Shampoo",
+                        help="Brand-friendly display name"
+                    )
+
+                with col2:
+                    prod_category = st.selectbox(
+                        "Category*",
+                        ["haircare", "skincare", "bodycare", "cosmetics", "wellness", "other"],
+                        key=f"prod_cat_{i}"
+                    )
+
+                prod_desc = st.text_area(
+                    "Description*",
+                    key=f"prod_desc_{i}",
+                    placeholder="e.g., Citrus-infused cleansing shampoo with natural extracts",
+                    help="Product description (10-500 characters)",
+                    max_chars=500,
+                    height=80
+                )
+
+                st.markdown("**Creative Brief**")
+
+                setting = st.text_input(
+                    "Setting",
+                    key=f"setting_{i}",
+                    value="Clean studio environment",
+                    placeholder="e.g., Fresh bathroom scene with natural elements"
+                )
+
+                mood = st.text_input(
+                    "Mood",
+                    key=f"mood_{i}",
+                    value="Fresh and energetic",
+                    placeholder="e.g., Energetic, fresh, clean"
+                )
+
+                visual_elements = st.text_input(
+                    "Key Visual Elements",
+                    key=f"visual_{i}",
+                    placeholder="Product bottle, water splash, natural light (comma-separated)",
+                    help="Important elements to include (comma-separated)"
+                )
+
+                st.markdown("**Brand Style**")
+
+                colors = st.text_input(
+                    "Color Palette",
+                    key=f"colors_{i}",
+                    value="#FF6B35, #004E89, #FFFFFF",
+                    placeholder="#FF6B35, #004E89, #FFFFFF",
+                    help="2-5 brand colors in hex format (comma-separated)"
+                )
+
+                visual_style = st.text_input(
+                    "Visual Style",
+                    key=f"vstyle_{i}",
+                    value="Clean and modern",
+                    placeholder="e.g., Modern minimalist, Natural organic"
+                )
+
+                photo_style = st.text_input(
+                    "Photography Style",
+                    key=f"pstyle_{i}",
+                    value="Commercial product photography",
+                    placeholder="e.g., Commercial product photography"
+                )
+
+                # Store product data
+                if prod_id and prod_name and prod_desc:
+                    products.append({
+                        "id": prod_id,
+                        "name": prod_name,
+                        "description": prod_desc,
+                        "category": prod_category,
+                        "creative_brief": {
+                            "setting": setting,
+                            "mood": mood,
+                            "key_visual_elements": _csv(visual_elements)
+                        },
+                        "brand_style": {
+                            "color_palette": _csv(colors),
+                            "visual_style": visual_style,
+                            "photography_style": photo_style
+                        }
+                    })
+
+        # Submit button
+        st.markdown("---")
+        submitted = st.form_submit_button("✅ Create Campaign Brief", type="primary", use_container_width=True)
+
+        if submitted:
+            # Validate required fields
+            if not campaign_id:
+                st.error("❌ Campaign ID is required")
+                return
+
+            if not campaign_message:
+                st.error("❌ Campaign message is required")
+                return
+
+            if len(products) < 2:
+                st.error("❌ At least 2 products are required")
+                return
+
+            # Parse locales
+            locales = _csv(locales_input)
+            if not locales:
+                st.error("❌ At least one locale is required")
+                return
+
+            # Build campaign brief
+            brief_data = {
+                "campaign_id": campaign_id,
+                "region": region,
+                "target_audience": target_audience,
+                "campaign_message": campaign_message,
+                "locales": locales,
+                "products": products
+            }
+
+            brief_created = False
+            try:
+                # Skip Pydantic re-validation when the form content is
+                # unchanged since the last successful submit
+                serialized = json.dumps(brief_data, sort_keys=True)
+                form_hash = hashlib.blake2b(serialized.encode(), digest_size=16).digest()
+
+                if st.session_state.get('manual_brief_hash') != form_hash:
+                    from src.models import CampaignBrief
+                    st.session_state.brief = CampaignBrief(**brief_data)
+                    st.session_state.brief_data = brief_data
+                    st.session_state.manual_brief_hash = form_hash
+                    brief_created = True
+                brief = st.session_state.brief
+
+                st.success(f"✅ Campaign brief created: **{campaign_id}**")
+
+                # Show summary
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    st.metric("Products", len(brief.products))
+                with col2:
+                    st.metric("Locales", len(brief.locales))
+                with col3:
+                    st.metric("Region", brief.region)
+
+                # Option to download as JSON
+                st.markdown("---")
+                json_str = json.dumps(brief_data, indent=2)
+                st.download_button(
+                    "💾 Download as JSON",
+                    data=json_str,
+                    file_name=f"{campaign_id}_brief.json",
+                    mime="application/json"
+                )
+
+            except Exception as e:
+                st.error(f"❌ Validation error: {e}")
+
+            # A fragment rerun stops at the fragment boundary, but the
+            # Run Campaign section lives in the outer page body, which
+            # has already rendered without the new brief — escalate to a
+            # full-app rerun so it appears. Outside the try so the broad
+            # validation handler can't swallow the rerun signal.
+            if brief_created:
+                st.rerun(scope="app")
+
+
+@st.fragment
+def _existing_assets_section():
+    """Render the existing-assets grid with per-image delete buttons."""
+    existing_assets = uploader.list_existing_assets()
+    if not existing_assets:
+        return
+
+    st.markdown("---")
+    st.subheader("Existing Assets")
+    cols = st.columns(4)
+    for idx, asset_path in enumerate(existing_assets):
+        with cols[idx % 4]:
+            st.image(
+                thumbnail_bytes(str(asset_path), asset_path.stat().st_mtime),
+                caption=asset_path.name,
+                use_container_width=True
+            )
+            if st.button(f"🗑️ Delete", key=f"del_{asset_path.name}"):
+                if uploader.delete_asset(asset_path):
+                    st.success(f"Deleted {asset_path.name}")
+                    st.rerun(scope="fragment")
+                else:
+                    st.error(f"Failed to delete {asset_path.name}")
+
+
+def campaign_page():
+    """Campaign execution page - upload brief, assets, and run pipeline."""
+    st.header("🚀 Run Campaign")
+    st.markdown("""
+    **Hero + Variants Architecture:** Generate or reuse hero images for each product, then automatically create
+    aspect ratio variations (1:1, 9:16, 16:9) and localized compositions.
+    """)
+
+    with st.expander("ℹ️ How it works"):
+        st.markdown("""
+        **Phase 1: Hero Images**
+        - Check input folder for user-provided images
+        - Check cache for previously generated heroes
+        - Generate new heroes via DALL-E 3 only if needed
+
+        **Phase 2: Variations** (local processing, no API cost)
+        - Create aspect ratio crops: 1:1 (Instagram), 9:16 (Stories), 16:9 (YouTube)
+        - Intelligent center-crop preserves subject focus
+
+        **Phase 3: Composition** (local processing, no API cost)
+        - Add localized text overlays
+        - Apply brand logos
+        - Run compliance checks
+
+        **Cost Example:** 2 products × 3 aspects × 2 locales = 12 final assets
+        - Hero generation: 2 × $0.08 = **$0.16**
+        - Variations & composition: **$0.00** (local processing)
+        - With cache: **$0.00** (all heroes reused)
+        """)
+
+    # Initialize session state for brief
+    if 'brief' not in st.session_state:
+        st.session_state.brief = None
+    if 'brief_data' not in st.session_state:
+        st.session_state.brief_data = None
+
+    # Section 1: Upload or Create Campaign Brief
+    with st.expander("📋 Campaign Brief", expanded=True):
+        # Tab selection: Upload or Create
+        brief_tab = st.radio(
+            "Choose method",
+            ["📤 Upload JSON", "✍️ Create Manually"],
+            horizontal=True,
+            label_visibility="collapsed"
+        )
+
+        if brief_tab == "📤 Upload JSON":
+            uploaded_brief = st.file_uploader(
+                "Upload campaign brief (JSON)",
+                type=['json'],
+                key="brief_uploader",
+                help="Upload a JSON file containing campaign configuration"
+            )
+
+            if uploaded_brief:
+                # Only re-parse and re-validate when the uploaded bytes
+                # actually change; reruns reuse the session-state brief
+                raw = uploaded_brief.getvalue()
+                brief_hash = hashlib.blake2b(raw, digest_size=16).digest()
+
+                if st.session_state.get('brief_hash') != brief_hash:
+                    try:
+                        # Parse JSON
+                        brief_data = json.loads(raw)
+                        st.session_state.brief_data = brief_data
+
+                        # Validate with Pydantic
+                        from src.models import CampaignBrief
+                        st.session_state.brief = CampaignBrief(**brief_data)
+                        st.session_state.brief_error = None
+                    except json.JSONDecodeError as e:
+                        st.session_state.brief = None
+                        st.session_state.brief_error = f"❌ Invalid JSON: {e}"
+                    except Exception as e:
+                        st.session_state.brief = None
+                        st.session_state.brief_error = f"❌ Invalid campaign brief: {e}"
+                    st.session_state.brief_hash = brief_hash
+
+                if st.session_state.get('brief_error'):
+                    st.error(st.session_state.brief_error)
+                elif st.session_state.brief:
+                    brief = st.session_state.brief
+
+                    st.success(f"✓ Valid brief: **{brief.campaign_id}**")
+
+                    # Show brief summary
+                    col1, col2, col3 = st.columns(3)
+                    with col1:
+                        st.metric("Products", len(brief.products))
+                    with col2:
+                        st.metric("Locales", len(brief.locales))
+                    with col3:
+                        st.metric("Region", brief.region)
+
+                    # Show full brief in expandable section
+                    with st.expander("View Full Brief"):
+                        st.json(st.session_state.brief_data)
+            else:
+                st.info("👆 Upload a campaign brief to get started")
+
+        else:  # Create Manually
+            manual_campaign_form()
+
+    # Section 2: Upload Input Assets (Optional)
+    with st.expander("🖼️ Input Assets (Optional)", expanded=False):
+        st.markdown("""
+        Upload product images to use instead of generating them.
+
+        **Naming convention:**
+        - `{product_id}.png` - Generic image for all aspect ratios
+        - `{product_id}_{aspect_ratio}.png` - Specific to aspect ratio (e.g., `shampoo_citrus_500ml_1x1.png`)
+        """)
+
+        uploaded_assets = st.file_uploader(
+            "Upload product images",
+            type=['png', 'jpg', 'jpeg'],
+            accept_multiple_files=True,
+            key="asset_uploader"
+        )
+
+        if uploaded_assets:
+            st.subheader("Uploaded Assets Preview")
+            cols = st.columns(4)
+            for idx, asset in enumerate(uploaded_assets):
+                with cols[idx % 4]:
+                    st.image(asset, caption=asset.name, use_container_width=True)
+
+            # Validation warnings
+            if st.session_state.brief:
+                product_ids = [p.id for p in st.session_state.brief.products]
+                for asset in uploaded_assets:
+                    error = uploader.validate_asset_naming(asset.name, product_ids)
+                    if error:
+                        st.warning(f"⚠️ {error}")
+
+        # Show existing assets (fragment: deletes rerun only this grid)
+        _existing_assets_section()
+
+    # Section 3: Execute Pipeline
+    st.markdown("---")
+
+    if not st.session_state.brief:
+        st.warning("⚠️ Please upload a campaign brief first")
+        return
+
+    # Check API key
+    if not api_key_present():
+        st.error("❌ OpenAI API key not configured. Please set OPENAI_API_KEY in .env file")
+        return
+
+    # Run button
+    if st.button("🚀 Run Campaign", type="primary", use_container_width=True):
+        # Save uploaded assets if any
+        if uploaded_assets:
+            with st.spinner("Saving uploaded assets..."):
+                saved = uploader.save_input_assets(uploaded_assets)
+                if saved:
+                    st.success(f"✓ Saved {len(saved)} asset(s)")
+
+        # Execute pipeline
+        with st.status("Generating assets...", expanded=True) as status:
+            try:
+                from src.pipeline import CampaignPipeline
+                from src.utils import Config
+
+                # Load config
+                st.write("📝 Loading configuration...")
+                config = Config.load()
+
+                # Initialize pipeline; closed on exit so each Run click
+                # doesn't leave another idle worker pool alive in the
+                # long-running Streamlit process
+                st.write("🔧 Initializing pipeline...")
+                with CampaignPipeline(config) as pipeline:
+                    # Run pipeline
+                    st.write("🎨 Generating campaign assets...")
+                    report = pipeline.run(st.session_state.brief)
+
+                status.update(label="✅ Campaign Complete!", state="complete")
+
+                # Invalidate cached gallery/report data so new results appear
+                gallery.clear_caches()
+                reports.clear_caches()
+
+                # Display report
+                st.markdown("---")
+                reports.display_execution_report(report)
+
+                # Success message with link to gallery
+                st.success("🎉 Campaign generated successfully!")
+                if st.button("🖼️ View Assets in Gallery"):
+                    st.switch_page("pages/gallery.py")
+
+            except Exception as e:
+                status.update(label="❌ Campaign Failed", state="error")
+                st.error(f"Error: {e}")
+
+                # Show traceback in expandable
+                import traceback
+                with st.expander("🐛 Error Details"):
+                    st.code(traceback.format_exc())
+
+
+campaign_page()
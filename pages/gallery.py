@@ -0,0 +1,135 @@
+"""Gallery page - view and download generated assets."""
+
+from pathlib import Path
+
+import streamlit as st
+
+from ui import gallery
+from ui.common import thumbnail_bytes
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _read_png(path_str: str, mtime: float) -> bytes:
+    """Read one asset's bytes, cached so reruns don't re-read every PNG.
+
+    mtime is part of the cache key (like thumbnail_bytes): campaign
+    reruns overwrite assets in place, so a path-only key would keep
+    serving the previous run's bytes.
+    """
+    return Path(path_str).read_bytes()
+
+
+@st.fragment
+def _zip_download(campaign_id):
+    """Build the campaign ZIP only when the user asks for it.
+
+    Eagerly packaging on every rerun burned CPU and I/O for a button
+    most visits never click; the two-step prepare/download keeps the
+    page load free of ZIP work.
+    """
+    if st.button("📦 Prepare ZIP", use_container_width=True):
+        output_mtime = (Path("output") / campaign_id).stat().st_mtime
+        st.download_button(
+            "📦 Download All (ZIP)",
+            data=gallery.campaign_zip_bytes(campaign_id, output_mtime),
+            file_name=f"{campaign_id}_assets.zip",
+            mime="application/zip",
+            use_container_width=True
+        )
+
+
+@st.fragment
+def _render_product(product_id, assets):
+    """Render one product's asset grid; download clicks rerun only this card."""
+    with st.expander(f"📦 {product_id}", expanded=True):
+        if not assets:
+            st.info("No assets found for this product")
+            return
+
+        # Index assets by (aspect_ratio, locale) in one pass instead of
+        # re-scanning the asset list for every grid cell
+        index = {gallery.get_asset_info(a): a for a in assets}
+        ratio_order = ["1x1", "9x16", "16x9"]
+        found_ratios = {ratio for ratio, _ in index}
+        aspect_ratios = [r for r in ratio_order if r in found_ratios]
+        locales = sorted({locale for _, locale in index})
+
+        # Create grid: columns for aspect ratios
+        if aspect_ratios:
+            cols = st.columns(len(aspect_ratios))
+
+            for col_idx, ratio in enumerate(aspect_ratios):
+                with cols[col_idx]:
+                    st.subheader(ratio.replace('x', ':'))
+
+                    # Show assets for each locale in this aspect ratio
+                    for locale in locales:
+                        asset_path = index.get((ratio, locale))
+
+                        if asset_path:
+                            asset_mtime = asset_path.stat().st_mtime
+
+                            # Display downscaled preview; full resolution
+                            # still flows through the download button
+                            st.image(
+                                thumbnail_bytes(str(asset_path), asset_mtime, width=512),
+                                caption=f"{locale.upper()}",
+                                use_container_width=True
+                            )
+
+                            # Download button
+                            st.download_button(
+                                f"⬇️ Download {locale.upper()}",
+                                data=_read_png(str(asset_path), asset_mtime),
+                                file_name=asset_path.name,
+                                mime="image/png",
+                                key=f"dl_{product_id}_{ratio}_{locale}",
+                                use_container_width=True
+                            )
+
+
+def gallery_page():
+    """Asset gallery page - view and download generated assets."""
+    st.header("🖼️ Asset Gallery")
+    st.markdown("Browse and download generated campaign assets.")
+
+    # Get all campaigns
+    campaigns = gallery.list_campaigns_cached()
+
+    if not campaigns:
+        st.info("📭 No campaigns found. Run a campaign first to see assets here.")
+        return
+
+    # Campaign selector
+    selected_campaign = st.selectbox(
+        "Select Campaign",
+        campaigns,
+        key="gallery_campaign_selector"
+    )
+
+    if not selected_campaign:
+        return
+
+    # Load assets for selected campaign
+    assets_by_product = gallery.load_campaign_assets_cached(selected_campaign)
+
+    if not assets_by_product:
+        st.warning(f"No assets found for campaign: {selected_campaign}")
+        return
+
+    # Bulk download (ZIP built on demand)
+    col1, col2 = st.columns([3, 1])
+    with col2:
+        _zip_download(selected_campaign)
+
+    st.markdown("---")
+
+    # Display assets by product (each card is an independent fragment)
+    for product_id, assets in assets_by_product.items():
+        _render_product(product_id, assets)
+
+    st.markdown("---")
+    st.caption(f"Showing assets from: `output/{selected_campaign}/`")
+
+
+gallery_page()
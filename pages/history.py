@@ -0,0 +1,172 @@
+"""Execution history page - view past campaigns and reports."""
+
+import streamlit as st
+
+from ui import reports
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _reports_df(logs_mtime: float):
+    """Load all execution reports into a DataFrame once per logs-dir state."""
+    import pandas as pd
+
+    df = pd.DataFrame(reports.load_all_reports_cached(logs_mtime))
+    if df.empty:
+        return df
+
+    df['total_assets'] = df['compliance_summary'].map(
+        lambda x: (x or {}).get('total_assets', 0)
+    )
+    return df.sort_values('timestamp', ascending=False)
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _reports_records(logs_mtime: float):
+    """Row-dict view of the reports frame for the details/compare sections."""
+    df = _reports_df(logs_mtime)
+    return [] if df.empty else df.to_dict('records')
+
+
+def history_page():
+    """Execution history page - view past campaigns and reports."""
+    st.header("📊 Execution History")
+    st.markdown("View execution reports and performance metrics for past campaigns.")
+
+    # Load all reports (cached, vectorized)
+    df = _reports_df(reports.logs_mtime())
+
+    if df.empty:
+        st.info("📭 No execution history yet. Run a campaign to see reports here.")
+        return
+
+    import pandas as pd
+    from datetime import datetime
+
+    # Summary statistics (vectorized column ops instead of per-report sums)
+    st.subheader("📈 Summary")
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        st.metric("Total Campaigns", len(df))
+
+    with col2:
+        st.metric("Total Assets", int(df['total_assets'].sum()))
+
+    with col3:
+        st.metric("Total Cost", f"${df['total_cost'].sum():.2f}")
+
+    with col4:
+        avg_cache = df['cache_efficiency'].fillna(0).mean()
+        st.metric("Avg Cache Hit", f"{avg_cache:.0f}%")
+
+    st.markdown("---")
+
+    # Campaign list as table
+    st.subheader("📋 Campaign Reports")
+
+    # Keep columns numeric/datetime and let column_config format them
+    # client-side — no per-cell f-strings, smaller Arrow payload.
+    # Built as a pyarrow Table directly, skipping the intermediate
+    # DataFrame and its dtype-inference pass inside st.dataframe.
+    import pyarrow as pa
+
+    table = pa.table({
+        "Campaign": pa.array(df['campaign_id']),
+        "Date": pa.array(pd.to_datetime(df['timestamp'], unit='s')),
+        "Products": pa.array(df['products_count']),
+        "Assets": pa.array(df['total_assets']),
+        "Heroes Gen": pa.array(df['hero_images_generated']),
+        "Heroes Cached": pa.array(df['hero_images_cached']),
+        "Cost": pa.array(df['total_cost']),
+        "Time": pa.array(df['execution_time'])
+    })
+
+    # Display table with highlighting
+    st.dataframe(
+        table,
+        use_container_width=True,
+        hide_index=True,
+        column_config={
+            "Campaign": st.column_config.TextColumn("Campaign", width="medium"),
+            "Date": st.column_config.DatetimeColumn("Date", format="YYYY-MM-DD HH:mm", width="small"),
+            "Cost": st.column_config.NumberColumn("Cost", format="$%.2f", width="small"),
+            "Time": st.column_config.NumberColumn("Time", format="%.1fs", width="small")
+        }
+    )
+
+    st.markdown("---")
+
+    # Report details selector
+    st.subheader("🔍 Campaign Details")
+
+    all_reports = _reports_records(reports.logs_mtime())
+    by_id = {r['campaign_id']: r for r in all_reports}
+    campaign_ids = df['campaign_id'].tolist()
+    selected = st.selectbox("Select campaign to view details", campaign_ids, key="history_detail_selector")
+
+    if selected:
+        # Find the report
+        report = by_id.get(selected)
+
+        if report:
+            reports.display_report_details(report)
+
+    # Comparison section
+    st.markdown("---")
+    st.subheader("📊 Compare Campaigns")
+
+    if len(all_reports) >= 2:
+        selected_campaigns = st.multiselect(
+            "Select campaigns to compare (up to 5)",
+            campaign_ids,
+            max_selections=5,
+            key="history_compare"
+        )
+
+        if len(selected_campaigns) >= 2:
+            # Vectorized over the cached frame: column arithmetic in
+            # NumPy instead of per-row dict gets (the {} defaults used
+            # to materialize a temporary dict per report)
+            import numpy as np
+
+            sel = df[df['campaign_id'].isin(selected_campaigns)]
+
+            if not sel.empty:
+                heroes = (sel['hero_images_generated'] + sel['hero_images_cached']).to_numpy(dtype=float)
+                cached = sel['hero_images_cached'].to_numpy(dtype=float)
+                cache_pct = np.divide(
+                    cached * 100, heroes,
+                    out=np.zeros_like(heroes), where=heroes > 0
+                )
+
+                comp_df = pd.DataFrame({
+                    "Campaign": sel['campaign_id'].to_numpy(),
+                    "Products": sel['products_count'].to_numpy(),
+                    "Assets": sel['total_assets'].to_numpy(),
+                    "Heroes": heroes.astype(int),
+                    "Cost": sel['total_cost'].to_numpy(),
+                    "Time (s)": sel['execution_time'].to_numpy(),
+                    "Hero Cache %": cache_pct
+                })
+
+                # Show comparison table
+                st.dataframe(comp_df, use_container_width=True, hide_index=True)
+
+                # Show comparison charts (index once; set_index copies)
+                indexed = comp_df.set_index('Campaign')
+                col1, col2 = st.columns(2)
+
+                with col1:
+                    st.markdown("**Cost Comparison**")
+                    st.bar_chart(indexed['Cost'])
+
+                with col2:
+                    st.markdown("**Hero Cache Efficiency**")
+                    st.bar_chart(indexed['Hero Cache %'])
+        else:
+            st.info("Select at least 2 campaigns to compare")
+    else:
+        st.info("Need at least 2 campaigns to enable comparison")
+
+
+history_page()
@@ -7,9 +7,9 @@ import os
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-# Import and run main
-from src.__main__ import main
-
 if __name__ == "__main__":
+    # Imported here so `import run_prism` stays cheap; the CLI module
+    # itself defers the heavy pipeline imports until after arg parsing
+    from src.__main__ import main
     sys.exit(main())
 
@@ -4,10 +4,10 @@ import argparse
 import sys
 import json
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from src.models import CampaignBrief, ExecutionReport
-from src.pipeline import CampaignPipeline
-from src.utils import Config, load_json
+if TYPE_CHECKING:
+    from src.models import ExecutionReport
 
 
 def main():
@@ -39,7 +39,13 @@ def main():
     )
     
     args = parser.parse_args()
-    
+
+    # Imported after arg parsing so --help and bad invocations don't pay
+    # for PIL/openai/pydantic, which these modules pull in transitively
+    from src.models import CampaignBrief
+    from src.pipeline import CampaignPipeline
+    from src.utils import Config, load_json
+
     try:
         # Clear cache if requested
         if args.clear_cache:
@@ -66,22 +72,22 @@ def main():
         print(f"Locales: {', '.join(brief.locales)}")
         print(f"\nProcessing campaign...\n")
         
-        # Initialize pipeline
-        pipeline = CampaignPipeline(config)
-        
-        # Run pipeline (possibly twice for cache verification)
-        runs = 2 if args.verify_cache else 1
-        for run in range(runs):
-            if runs > 1:
-                print(f"\n{'='*50}")
-                print(f"Run {run + 1} of {runs}")
-                print(f"{'='*50}\n")
-            
-            report = pipeline.run(brief)
-            
-            # Display results after each run
-            _display_report(report, run + 1 if runs > 1 else None)
-        
+        # Initialize pipeline; the context manager shuts down its
+        # persistent worker pool when the runs are done
+        with CampaignPipeline(config) as pipeline:
+            # Run pipeline (possibly twice for cache verification)
+            runs = 2 if args.verify_cache else 1
+            for run in range(runs):
+                if runs > 1:
+                    print(f"\n{'='*50}")
+                    print(f"Run {run + 1} of {runs}")
+                    print(f"{'='*50}\n")
+
+                report = pipeline.run(brief)
+
+                # Display results after each run
+                _display_report(report, run + 1 if runs > 1 else None)
+
         return 0
         
     except FileNotFoundError as e:
@@ -100,41 +106,50 @@ def main():
         return 1
 
 
-def _display_report(report: ExecutionReport, run_number=None):
-    """Display execution report."""
+def _display_report(report: "ExecutionReport", run_number=None):
+    """Display execution report in a single stdout write."""
     header = "Campaign Execution Complete"
     if run_number:
         header = f"Run {run_number} Complete"
-    
-    print("\n" + "="*50)
-    print(header)
-    print("="*50)
-    print(f"Campaign ID: {report.campaign_id}")
-    print(f"Products processed: {report.products_count}")
-    print(f"Assets generated: {report.assets_generated}")
-    print(f"Assets reused: {report.assets_reused}")
-    print(f"Total cost: ${report.total_cost:.2f}")
-    print(f"Execution time: {report.execution_time:.2f}s")
-    print(f"Cache efficiency: {report.cache_efficiency:.1f}%")
-    print(f"Worker count: {report.worker_count}")
-    print(f"Output path: {report.output_path}")
-    
+
+    # Collect lines and write once: on line-buffered TTYs and log pipes
+    # each print is a separate syscall + flush
+    lines = [
+        "",
+        "="*50,
+        header,
+        "="*50,
+        f"Campaign ID: {report.campaign_id}",
+        f"Products processed: {report.products_count}",
+        f"Assets generated: {report.assets_generated}",
+        f"Assets reused: {report.assets_reused}",
+        f"Total cost: ${report.total_cost:.2f}",
+        f"Execution time: {report.execution_time:.2f}s",
+        f"Cache efficiency: {report.cache_efficiency:.1f}%",
+        f"Worker count: {report.worker_count}",
+        f"Output path: {report.output_path}",
+    ]
+
     if report.compliance_summary:
         comp = report.compliance_summary
-        print(f"\nCompliance Summary:")
-        print(f"  Total assets: {comp.get('total_assets', 0)}")
-        print(f"  Passed: {comp.get('passed', 0)}")
-        print(f"  Warnings: {comp.get('warnings', 0)}")
-        print(f"  Errors: {comp.get('errors', 0)}")
-    
+        lines += [
+            "",
+            "Compliance Summary:",
+            f"  Total assets: {comp.get('total_assets', 0)}",
+            f"  Passed: {comp.get('passed', 0)}",
+            f"  Warnings: {comp.get('warnings', 0)}",
+            f"  Errors: {comp.get('errors', 0)}",
+        ]
+
     if report.errors:
-        print(f"\nWarnings/Errors: {len(report.errors)}")
-        for error in report.errors[:5]:
-            print(f"  - {error}")
-    
-    print("\n" + "="*50)
+        lines += ["", f"Warnings/Errors: {len(report.errors)}"]
+        lines += [f"  - {error}" for error in report.errors[:5]]
+
+    lines += ["", "="*50]
     if not run_number:
-        print("Campaign processing completed successfully!")
+        lines.append("Campaign processing completed successfully!")
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":
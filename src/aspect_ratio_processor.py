@@ -1,7 +1,35 @@
 """Intelligent aspect ratio processing for creating variations from hero images."""
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict
 from PIL import Image, ImageOps
+import numpy as np
+
+# Optional libvips fast path: vectorized, threaded resize kernels that are
+# several times faster than Pillow's scalar LANCZOS loop. Falls back to
+# Pillow when pyvips is not installed.
+try:
+    import pyvips
+    _HAS_VIPS = True
+except ImportError:
+    pyvips = None
+    _HAS_VIPS = False
+
+# OpenCV's resize is SIMD-vectorized and internally threaded (~2x faster
+# than Pillow at LANCZOS) and works on a shared numpy view of the hero,
+# so the decoded buffer is reused across all variations.
+try:
+    import cv2
+    _HAS_CV2 = True
+except ImportError:
+    cv2 = None
+    _HAS_CV2 = False
+
+
+# Shared pool for the three independent per-hero resizes. Pillow releases
+# the GIL inside its resize kernels, so threads scale on multi-core; a
+# singleton avoids per-call thread spawn overhead.
+_VARIATION_POOL = ThreadPoolExecutor(max_workers=3)
 
 
 # Target sizes for each aspect ratio (optimized for social platforms)
@@ -14,47 +42,65 @@ ASPECT_RATIO_SIZES = {
 
 class AspectRatioProcessor:
     """Create aspect ratio variations from hero images using intelligent cropping."""
-    
+
     def __init__(self, config: dict):
         """Initialize processor with configuration."""
         self.config = config
         processing_config = config.get('aspect_ratio_processing', {})
         self.crop_strategy = processing_config.get('crop_strategy', 'center')
         self.quality = processing_config.get('quality', 95)
-    
+        # INTER_AREA is the fast, correct filter for shrinking; it only
+        # applies on actual downscales (on upscales OpenCV degrades it to
+        # nearest-neighbour, so those keep LANCZOS4)
+        self.fast_resize = processing_config.get('fast_resize', True)
+
+        # Per-ratio dispatch table: a single dict lookup replaces the size
+        # lookup plus the string-compare chain on the N x 3 hot path.
+        # Square heroes only need a resize; the others center-crop.
+        self._dispatch = {
+            "1:1": (ASPECT_RATIO_SIZES["1:1"], self._resize),
+            "9:16": (ASPECT_RATIO_SIZES["9:16"], self._center_crop),
+            "16:9": (ASPECT_RATIO_SIZES["16:9"], self._center_crop)
+        }
+
     def create_variation(self, hero_image: Image.Image, target_aspect: str) -> Image.Image:
         """
         Create an aspect ratio variation from a hero image.
-        
+
         Args:
             hero_image: Source hero image (1024x1024)
             target_aspect: Target aspect ratio ("1:1", "9:16", "16:9")
-        
+
         Returns:
             Cropped/resized image at target aspect ratio
         """
-        target_size = ASPECT_RATIO_SIZES.get(target_aspect, (1080, 1080))
-        
-        if target_aspect == "1:1":
-            # For square, just resize the hero image
-            return hero_image.resize(target_size, Image.Resampling.LANCZOS)
-        
-        elif target_aspect == "9:16":
-            # Portrait: crop from center for vertical format
-            return self._center_crop(hero_image, target_size)
-        
-        elif target_aspect == "16:9":
-            # Landscape: crop from center for horizontal format
-            return self._center_crop(hero_image, target_size)
-        
-        else:
-            # Fallback: resize to target
-            return hero_image.resize(target_size, Image.Resampling.LANCZOS)
-    
+        target_size, transform = self._dispatch.get(
+            target_aspect, ((1080, 1080), self._resize)
+        )
+        # The fast paths honor the dispatched transform too: 1:1 is a
+        # plain squash-resize everywhere, not a center crop only when
+        # cv2/vips happen to be importable
+        crop = transform == self._center_crop
+
+        if _HAS_VIPS:
+            return self._from_vips(
+                self._vips_variation(self._to_vips(hero_image), target_size, crop)
+            )
+
+        if _HAS_CV2:
+            arr = np.asarray(hero_image.convert('RGB'))
+            return Image.fromarray(self._cv2_variation(arr, target_size, crop))
+
+        return transform(hero_image, target_size)
+
+    def _resize(self, image: Image.Image, target_size: tuple) -> Image.Image:
+        """Plain resize for variations that keep the source aspect."""
+        return image.resize(target_size, Image.Resampling.LANCZOS)
+
     def _center_crop(self, image: Image.Image, target_size: tuple) -> Image.Image:
         """
         Perform center-weighted crop using PIL's ImageOps.fit.
-        
+
         This maintains the central subject while adapting to target dimensions.
         """
         return ImageOps.fit(
@@ -63,20 +109,157 @@ class AspectRatioProcessor:
             method=Image.Resampling.LANCZOS,
             centering=(0.5, 0.5)  # Center crop
         )
-    
-    def create_all_variations(self, hero_image: Image.Image) -> Dict[str, Image.Image]:
+
+    @staticmethod
+    def _arr_to_vips(arr: np.ndarray) -> "pyvips.Image":
+        """Wrap a uint8 HxWx3 array as a vips image without re-encoding."""
+        height, width, bands = arr.shape
+        return pyvips.Image.new_from_memory(arr.tobytes(), width, height, bands, 'uchar')
+
+    @staticmethod
+    def _vips_to_arr(vips_image: "pyvips.Image") -> np.ndarray:
+        """Materialize a vips image as a uint8 array."""
+        arr = np.frombuffer(vips_image.write_to_memory(), dtype=np.uint8)
+        return arr.reshape(vips_image.height, vips_image.width, vips_image.bands)
+
+    @classmethod
+    def _to_vips(cls, image: Image.Image) -> "pyvips.Image":
+        """Convert a PIL image to a vips image without re-encoding."""
+        return cls._arr_to_vips(np.asarray(image.convert('RGB')))
+
+    @classmethod
+    def _from_vips(cls, vips_image: "pyvips.Image") -> Image.Image:
+        """Convert a vips image back to PIL."""
+        return Image.fromarray(cls._vips_to_arr(vips_image))
+
+    def _cv2_variation(self, arr: np.ndarray, target_size: tuple,
+                       crop: bool = True) -> np.ndarray:
+        """Resize through OpenCV, center-cropping first when requested.
+
+        The crop is a slice of the shared buffer, no copy; crop=False
+        squash-resizes the full frame (the 1:1 transform).
         """
-        Create all aspect ratio variations from a hero image.
-        
+        src_h, src_w = arr.shape[:2]
+        target_w, target_h = target_size
+
+        if crop:
+            target_ratio = target_w / target_h
+            if src_w / src_h > target_ratio:
+                crop_w, crop_h = round(src_h * target_ratio), src_h
+            else:
+                crop_w, crop_h = src_w, round(src_w / target_ratio)
+            x0 = (src_w - crop_w) // 2
+            y0 = (src_h - crop_h) // 2
+            source = arr[y0:y0 + crop_h, x0:x0 + crop_w]
+        else:
+            crop_w, crop_h = src_w, src_h
+            source = arr
+
+        if self.fast_resize and crop_w >= target_w and crop_h >= target_h:
+            interpolation = cv2.INTER_AREA
+        else:
+            interpolation = cv2.INTER_LANCZOS4
+        return cv2.resize(source, target_size, interpolation=interpolation)
+
+    @staticmethod
+    def _vips_variation(vips_image: "pyvips.Image", target_size: tuple,
+                        crop: bool = True) -> "pyvips.Image":
+        """Resize through libvips' streamed SIMD pipeline.
+
+        crop=True center-crops to the target aspect; crop=False forces
+        the exact size, squashing like the 1:1 transform.
+        """
+        width, height = target_size
+        if crop:
+            return vips_image.thumbnail_image(
+                width, height=height, crop='centre', size='both'
+            )
+        return vips_image.thumbnail_image(width, height=height, size='force')
+
+    def create_all_variations_np(self, hero_image,
+                                 ratios=None) -> Dict[str, np.ndarray]:
+        """
+        Create aspect ratio variations, staying in the array domain.
+
+        Accepts a PIL hero or a uint8 HxWx3 array — the pipeline holds
+        heroes as arrays after post-processing, so the vips/cv2 backends
+        never rebuild a PIL image between phases.
+
+        Args:
+            hero_image: Source hero image (PIL Image or uint8 array)
+            ratios: Aspect ratios to produce (defaults to all known ratios)
+
+        Returns:
+            Dictionary mapping aspect ratio to a uint8 variation array
+        """
+        if ratios is None:
+            ratios = list(ASPECT_RATIO_SIZES.keys())
+        sizes = {r: ASPECT_RATIO_SIZES.get(r, (1080, 1080)) for r in ratios}
+
+        # Resample once per distinct target size; ratios that collide
+        # (duplicate config entries, or custom size maps) share the result.
+        # Note 16:9 cannot be derived by transposing the 9:16 output —
+        # the two crop windows select different pixels — so orientation
+        # pairs are still computed independently.
+        unique_sizes = list(dict.fromkeys(sizes.values()))
+
+        # Whether each size center-crops follows the dispatched transform
+        # of the first ratio mapping to it, so 1:1 squash-resizes here
+        # exactly as it does on the PIL path
+        crop_for_size = {}
+        for aspect_ratio, size in sizes.items():
+            _, transform = self._dispatch.get(aspect_ratio, (size, self._resize))
+            crop_for_size.setdefault(size, transform == self._center_crop)
+
+        if _HAS_VIPS:
+            # Wrap the hero buffer once; the thumbnail ops share it
+            arr = hero_image if isinstance(hero_image, np.ndarray) \
+                else np.asarray(hero_image.convert('RGB'))
+            source = self._arr_to_vips(arr)
+            results = {
+                size: self._vips_to_arr(
+                    self._vips_variation(source, size, crop_for_size[size])
+                )
+                for size in unique_sizes
+            }
+        elif _HAS_CV2:
+            # Each variation slices the shared buffer
+            arr = hero_image if isinstance(hero_image, np.ndarray) \
+                else np.asarray(hero_image.convert('RGB'))
+            results = {
+                size: self._cv2_variation(arr, size, crop_for_size[size])
+                for size in unique_sizes
+            }
+        else:
+            # Run the GIL-free PIL resizes concurrently, one per distinct size
+            image = hero_image if isinstance(hero_image, Image.Image) \
+                else Image.fromarray(hero_image)
+            representative = {}
+            for aspect_ratio, size in sizes.items():
+                representative.setdefault(size, aspect_ratio)
+            futures = {
+                size: _VARIATION_POOL.submit(self.create_variation, image, aspect_ratio)
+                for size, aspect_ratio in representative.items()
+            }
+            results = {size: np.asarray(future.result()) for size, future in futures.items()}
+
+        return {aspect_ratio: results[sizes[aspect_ratio]] for aspect_ratio in ratios}
+
+    def create_all_variations(self, hero_image: Image.Image,
+                              ratios=None) -> Dict[str, Image.Image]:
+        """
+        Create aspect ratio variations from a hero image.
+
+        PIL-facing wrapper around create_all_variations_np.
+
         Args:
             hero_image: Source hero image
-        
+            ratios: Aspect ratios to produce (defaults to all known ratios)
+
         Returns:
             Dictionary mapping aspect ratio to cropped image
         """
-        variations = {}
-        for aspect_ratio in ASPECT_RATIO_SIZES.keys():
-            variations[aspect_ratio] = self.create_variation(hero_image, aspect_ratio)
-        
-        return variations
-
+        return {
+            aspect_ratio: Image.fromarray(arr)
+            for aspect_ratio, arr in self.create_all_variations_np(hero_image, ratios).items()
+        }
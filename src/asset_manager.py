@@ -2,16 +2,53 @@
 
 import os
 import hashlib
+from functools import lru_cache
 from typing import Optional, Tuple
 from pathlib import Path
 from PIL import Image
 
+# Cache keys don't need a cryptographic hash; xxh3 is 5-20x faster than
+# SHA-256 when available, with stdlib blake2b as the fallback.
+try:
+    import xxhash
+    _HAS_XXHASH = True
+except ImportError:
+    xxhash = None
+    _HAS_XXHASH = False
+
 from src.models import Product, CampaignBrief
 from src.image_generator import ImageGenerator
 from src.storage import LocalStorage
 from src.utils import ensure_dir
 
 
+@lru_cache(maxsize=None)
+def _ensure_dir_once(path: str):
+    """mkdir once per path per process.
+
+    Streamlit rebuilds the pipeline (and this manager) on reruns, so the
+    repeated ensure_dir became a pointless mkdir syscall per request.
+    """
+    ensure_dir(path)
+
+
+@lru_cache(maxsize=128)
+def _load_input_image(path_str: str, mtime_ns: int) -> Image.Image:
+    """Decode an input hero once per (path, mtime) and keep it resident.
+
+    PNG decode dominates input-folder hits; the same file is re-read for
+    every product sharing a global hero and on --verify-cache double runs.
+    The cached image is shared — treat it as read-only.
+    """
+    img = Image.open(path_str)
+    if img.format == 'JPEG':
+        # libjpeg's scaled IDCT decodes at 1/2, 1/4 or 1/8 resolution for
+        # nearly free; 2x the largest variation edge keeps LANCZOS headroom
+        img.draft('RGB', (2048, 2048))
+    img.load()
+    return img
+
+
 class AssetManager:
     """Manage hero image reuse with cache-first strategy."""
     
@@ -21,13 +58,16 @@ class AssetManager:
         self.image_generator = image_generator
         self.cache_storage = cache_storage
         self.input_folder = config.get('assets', {}).get('input_folder', './assets/input')
-        
+        self._input_path = Path(self.input_folder)
+        # Directory listings scanned lazily, once per run per folder
+        self._hero_listings: dict = {}
+
         # Hero cache configuration
         hero_config = config.get('hero_image', {})
         self.cache_enabled = hero_config.get('cache_enabled', True)
         
-        # Ensure input folder exists
-        ensure_dir(self.input_folder)
+        # Ensure input folder exists (memoized; no-op after first call)
+        _ensure_dir_once(self.input_folder)
     
     def get_or_generate_hero(self, product: Product, campaign_brief: CampaignBrief) -> Tuple[Image.Image, bool, float]:
         """
@@ -65,30 +105,51 @@ class AssetManager:
         
         return image, False, cost
     
+    def _list_heroes(self, subdir: str = '') -> set:
+        """Filenames under input/<subdir>, scanned once per run per folder.
+
+        One scandir replaces a stat per product per folder; at tens of
+        products that is the difference between 2 and 2N syscalls.
+        """
+        names = self._hero_listings.get(subdir)
+        if names is None:
+            folder = self._input_path / subdir if subdir else self._input_path
+            try:
+                with os.scandir(folder) as entries:
+                    names = {entry.name for entry in entries}
+            except OSError:
+                names = set()
+            self._hero_listings[subdir] = names
+        return names
+
     def _check_input_folder(self, product_id: str, campaign_id: str) -> Optional[Image.Image]:
         """
         Check input folder for user-provided hero images.
-        
+
         Priority:
-        1. Campaign-specific: assets/input/{campaign_id}/{product_id}.png
-        2. Global: assets/input/{product_id}.png
+        1. Campaign-specific: assets/input/{campaign_id}/{product_id}.{png,jpg,jpeg}
+        2. Global: assets/input/{product_id}.{png,jpg,jpeg}
         """
-        # Priority 1: Campaign-specific hero
-        campaign_hero = Path(self.input_folder) / campaign_id / f"{product_id}.png"
-        if campaign_hero.exists():
-            try:
-                return Image.open(str(campaign_hero))
-            except Exception:
-                pass
-        
-        # Priority 2: Global hero
-        global_hero = Path(self.input_folder) / f"{product_id}.png"
-        if global_hero.exists():
-            try:
-                return Image.open(str(global_hero))
-            except Exception:
-                pass
-        
+        candidates = tuple(f"{product_id}{ext}" for ext in ('.png', '.jpg', '.jpeg'))
+
+        for subdir in (campaign_id, ''):
+            names = self._list_heroes(subdir)
+            for filename in candidates:
+                if filename not in names:
+                    continue
+                folder = self._input_path / subdir if subdir else self._input_path
+                hero_path = folder / filename
+                try:
+                    # Single stat feeds the decode cache's mtime key
+                    stat = hero_path.stat()
+                    # Returned uncopied: the pipeline treats heroes as
+                    # read-only (the post-processor copies before mutating,
+                    # and resize/fit never touch their source), so the ~3 MB
+                    # per-hit copy was pure overhead
+                    return _load_input_image(str(hero_path), stat.st_mtime_ns)
+                except Exception:
+                    pass
+
         return None
     
     def _compute_cache_key(self, product_id: str, campaign_brief: CampaignBrief) -> str:
@@ -98,14 +159,16 @@ class AssetManager:
         Note: No aspect ratio in key since we cache hero images only.
         """
         content = f"{product_id}_{campaign_brief.campaign_message}_{campaign_brief.region}"
-        return hashlib.sha256(content.encode()).hexdigest()[:16]
+        if _HAS_XXHASH:
+            return xxhash.xxh3_64(content.encode()).hexdigest()
+        return hashlib.blake2b(content.encode(), digest_size=8).hexdigest()
     
     def _check_cache(self, cache_key: str) -> Optional[Image.Image]:
         """Check cache for previously generated hero."""
-        cache_path = f"hero_{cache_key}.png"
+        cache_path = f"hero_{cache_key}.webp"
         return self.cache_storage.load(cache_path)
-    
+
     def _save_to_cache(self, cache_key: str, image: Image.Image):
-        """Save generated hero to cache."""
-        cache_path = f"hero_{cache_key}.png"
+        """Save generated hero to cache (WebP: cheaper I/O than PNG)."""
+        cache_path = f"hero_{cache_key}.webp"
         self.cache_storage.save(cache_path, image)
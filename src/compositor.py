@@ -2,7 +2,7 @@
 
 import os
 from typing import Dict, Any, List, Tuple
-from PIL import Image, ImageDraw, ImageFont, ImageEnhance
+from PIL import Image, ImageDraw, ImageFont
 from pathlib import Path
 
 from src.utils import ensure_dir
@@ -36,132 +36,272 @@ class AssetCompositor:
         self.logo_position = self.brand_config.get('logo_position', 'bottom_right')
         self.logo_opacity = self.brand_config.get('logo_opacity', 0.9)
         self.logo_scale = self.brand_config.get('logo_scale', 0.1)
+
+        # Resolve the font file once and cache FreeType faces per size:
+        # opening a face is milliseconds of work that used to repeat for
+        # every asset and every step of the shrink-to-fit loop
+        self._resolved_font_path = self._resolve_font_path()
+        self._font_cache: Dict[int, ImageFont.FreeTypeFont] = {}
+        # Word advance widths memoized per (font, word): the shrink loop
+        # and repeated locales re-measure the same tokens
+        self._word_widths: Dict[tuple, float] = {}
+        # Finished logo tiles (decoded, resized, opacity applied) keyed by
+        # (path, target size) — a campaign pastes the same logo on every asset
+        self._logo_cache: Dict[Tuple[str, int], Image.Image] = {}
+        # Campaign logo paths resolved once (None = no logo); compose used
+        # to stat the same path for every asset
+        self._campaign_logo_paths: Dict[str, str] = {}
+        # Text geometry per (width, height, ratio) — a campaign has only a
+        # handful of distinct canvases but composes ratios x locales assets
+        self._geom_cache: Dict[Tuple[int, int, str], tuple] = {}
+        # Finished text layers (masks + color tiles) per (canvas, message,
+        # ratio): every product at a ratio/locale blits the same layer, so
+        # glyphs rasterize once per combination, not once per product
+        self._text_layer_cache: Dict[tuple, tuple] = {}
     
     def compose(self, base_image: Image.Image, campaign_message: str,
-               aspect_ratio: str, locale: str, campaign_id: str) -> Image.Image:
+               aspect_ratio: str, locale: str, campaign_id: str,
+               inplace: bool = False) -> Image.Image:
         """
         Compose final asset with text overlay and brand elements.
-        
+
         Args:
             base_image: Base generated image
             campaign_message: Campaign message to overlay
             aspect_ratio: Aspect ratio string
             locale: Locale code
             campaign_id: Campaign identifier for campaign-specific assets
-        
+            inplace: Draw directly on base_image. Only pass True for a
+                throwaway image — the pipeline shares each variation
+                across locales, so the default keeps the protective copy.
+
         Returns:
             Composed image with text and brand elements
         """
-        # Create a copy to avoid modifying original
-        img = base_image.copy()
+        # Since the text background became a crop/blend/paste and drawing
+        # happens in place, this copy is the last full-image pass left —
+        # and it only guards callers that reuse base_image afterwards
+        img = base_image if inplace else base_image.copy()
         
         # Overlay text
         img = self._overlay_text(img, campaign_message, aspect_ratio)
         
-        # Overlay campaign-specific logo if available (no fallback to generic logo)
-        campaign_logo_path = f"assets/brand/{campaign_id}/logo.png"
-        if os.path.exists(campaign_logo_path):
+        # Overlay campaign-specific logo if available (no fallback to generic
+        # logo); existence resolved once per campaign, not per asset
+        if campaign_id not in self._campaign_logo_paths:
+            candidate = f"assets/brand/{campaign_id}/logo.png"
+            self._campaign_logo_paths[campaign_id] = candidate if os.path.exists(candidate) else None
+
+        campaign_logo_path = self._campaign_logo_paths[campaign_id]
+        if campaign_logo_path:
             img = self._overlay_logo(img, aspect_ratio, campaign_logo_path)
         
         return img
     
+    def compose_batch(self, base_images: Dict[str, Image.Image],
+                      messages: Dict[str, str],
+                      campaign_id: str) -> Dict[Tuple[str, str], Image.Image]:
+        """
+        Compose every (aspect_ratio, locale) combination for a campaign.
+
+        Work is grouped by the invariant axis: the per-ratio state (font
+        size, text zone, logo tile) comes out of the instance caches after
+        the first locale, and locales whose localized message is identical
+        share one rendered image outright — rendering depends only on
+        (base image, message, ratio), not on the locale label.
+
+        Args:
+            base_images: Mapping of aspect ratio to base variation image
+            messages: Mapping of locale to localized campaign message
+            campaign_id: Campaign identifier for campaign-specific assets
+
+        Returns:
+            Dictionary mapping (aspect_ratio, locale) to composed image
+        """
+        results: Dict[Tuple[str, str], Image.Image] = {}
+        rendered: Dict[Tuple[str, str], Image.Image] = {}
+
+        for aspect_ratio, base_image in base_images.items():
+            for locale, message in messages.items():
+                render_key = (aspect_ratio, message)
+                if render_key not in rendered:
+                    rendered[render_key] = self.compose(
+                        base_image, message, aspect_ratio, locale, campaign_id
+                    )
+                results[(aspect_ratio, locale)] = rendered[render_key]
+
+        return results
+
     def _overlay_text(self, img: Image.Image, text: str, aspect_ratio: str) -> Image.Image:
         """Overlay text on image with proper positioning and styling."""
-        draw = ImageDraw.Draw(img)
-        img_width, img_height = img.size
-        
-        # Calculate font size based on image resolution
-        base_font_size = int(self.font_size * (img_width / 1024))
-        
+        bg_rect, pastes = self._text_layer(img.width, img.height, text, aspect_ratio)
+
+        # Darken only the background rectangle: crop + blend + paste
+        # touches rect-area bytes, versus the old full-canvas RGBA
+        # round-trip (new overlay, convert, alpha_composite, convert
+        # back) that moved ~16 MB per 1024^2 asset. This is the only
+        # per-product part — it blends with the base pixels.
+        bg_x1, bg_y1, bg_x2, bg_y2 = bg_rect
+        if bg_x2 > bg_x1 and bg_y2 > bg_y1:
+            region = img.crop((bg_x1, bg_y1, bg_x2, bg_y2))
+            shade = Image.new(region.mode, region.size, (0, 0, 0))
+            img.paste(Image.blend(region, shade, 128 / 255), (bg_x1, bg_y1))
+
+        # Blit the cached text layer — no glyph shaping or rasterization
+        # on repeat (message, ratio, canvas) combinations
+        for tile, origin, mask in pastes:
+            img.paste(tile, origin, mask)
+
+        # img stayed RGB throughout — no mode conversion needed
+        return img
+
+    def _text_layer(self, img_width: int, img_height: int, text: str,
+                    aspect_ratio: str) -> tuple:
+        """Rasterized text block for one (canvas, message, ratio), memoized.
+
+        Every product at a given ratio/locale draws the identical text
+        layer; caching it means glyph shaping and rasterization run once
+        per distinct combination instead of once per product.
+
+        Returns:
+            Tuple of (bg_rect, pastes) where pastes is a list of
+            (color_tile, origin, mask) ready for Image.paste
+        """
+        key = (img_width, img_height, text, aspect_ratio)
+        layer = self._text_layer_cache.get(key)
+        if layer is not None:
+            return layer
+
+        # Geometry is a pure function of (width, height, ratio): font base
+        # size, anchor position, wrap width and the vertical offset factor
+        # are computed once per distinct canvas and reused across locales
+        base_font_size, box_position, max_width, offset_factor = \
+            self._text_geometry(img_width, img_height, aspect_ratio)
+
         # Load font with fallback chain
         font = self._load_font_with_fallback(base_font_size)
-        
-        # Get text position based on aspect ratio
-        text_zone = TEXT_POSITIONS.get(aspect_ratio, "bottom_third")
-        box_position = self._get_text_position(img_width, img_height, text_zone)
-        
-        # Wrap text to fit within image width
-        max_width = int(img_width * 0.85)  # 85% of image width for better margins
-        lines = self._wrap_text(text, font, max_width)
-        
+        lines, line_widths = self._wrap_text(text, font, max_width)
+
         # Dynamic font sizing if text still too long
         if len(lines) > 3:  # More than 3 lines, reduce font size
             font = self._scale_font_to_fit(text, max_width, base_font_size, max_lines=3)
-            lines = self._wrap_text(text, font, max_width)
-        
-        # Calculate text block dimensions using actual line measurements
+            lines, line_widths = self._wrap_text(text, font, max_width)
+
+        # Heights still need a bbox (one per final line — the per-word
+        # measurements were already folded into wrapping)
         line_spacing = 10
         line_heights = []
-        line_widths = []
         for line in lines:
             bbox = font.getbbox(line)
             line_heights.append(bbox[3] - bbox[1])
-            line_widths.append(bbox[2] - bbox[0])
-        
+
         total_height = sum(line_heights) + (line_spacing * (len(lines) - 1))
-        max_line_width = max(line_widths) if line_widths else 0
+        max_line_width = int(max(line_widths)) if line_widths else 0
         
         # Add semi-transparent background for better readability
         # Account for outline width and add generous padding
         outline_padding = self.outline_width * 2
         padding = 25 + outline_padding
         
-        bg_x1 = max(0, box_position[0] - (max_line_width // 2) - padding)
-        bg_y1 = max(0, box_position[1] - (total_height // 2) - padding)
-        bg_x2 = min(img_width, box_position[0] + (max_line_width // 2) + padding)
-        bg_y2 = min(img_height, box_position[1] + (total_height // 2) + padding)
-        
-        # Draw semi-transparent background
-        overlay = Image.new('RGBA', img.size, (255, 255, 255, 0))
-        overlay_draw = ImageDraw.Draw(overlay)
-        overlay_draw.rectangle([bg_x1, bg_y1, bg_x2, bg_y2], fill=(0, 0, 0, 128))
-        img = img.convert('RGBA')
-        img = Image.alpha_composite(img, overlay)
-        draw = ImageDraw.Draw(img)
-        
-        # Calculate text offset adjustment based on aspect ratio (move text down within box)
+        bg_rect = (
+            max(0, box_position[0] - (max_line_width // 2) - padding),
+            max(0, box_position[1] - (total_height // 2) - padding),
+            min(img_width, box_position[0] + (max_line_width // 2) + padding),
+            min(img_height, box_position[1] + (total_height // 2) + padding)
+        )
+
+        # Move text down within box by the cached per-ratio factor
+        text_offset_adj = int(total_height * offset_factor)
+
+        # Rasterize the text block into small 'L' masks and blit the
+        # colors through them: glyphs write one channel of a block-sized
+        # buffer instead of three channels of the full canvas. The masks
+        # reuse the background rectangle's footprint, whose padding gives
+        # headroom for ascenders, descenders and the stroke.
+        mask_w = max_line_width + 2 * padding
+        mask_h = total_height + 2 * padding
+        origin = (box_position[0] - (max_line_width // 2) - padding,
+                  box_position[1] - (total_height // 2) - padding)
+
+        fill_mask = Image.new('L', (mask_w, mask_h), 0)
+        fill_draw = ImageDraw.Draw(fill_mask)
+        if self.outline_width > 0:
+            outline_mask = Image.new('L', (mask_w, mask_h), 0)
+            outline_draw = ImageDraw.Draw(outline_mask)
+        else:
+            outline_mask = None
+
+        # Lines keep their centered 'mm' anchors, translated into mask space
+        y_offset = -(total_height // 2) + text_offset_adj
+        for i, line in enumerate(lines):
+            pos = (box_position[0] - origin[0],
+                   box_position[1] + y_offset - origin[1])
+            if outline_mask is not None:
+                outline_draw.text(pos, line, font=font, fill=255,
+                                  stroke_width=self.outline_width,
+                                  stroke_fill=255, anchor="mm")
+            fill_draw.text(pos, line, font=font, fill=255, anchor="mm")
+            y_offset += line_heights[i] + line_spacing
+
+        # Stroke coverage first, glyph fill on top — two rect-sized pastes
+        pastes = []
+        if outline_mask is not None:
+            pastes.append((Image.new('RGB', (mask_w, mask_h), self.outline_color),
+                           origin, outline_mask))
+        pastes.append((Image.new('RGB', (mask_w, mask_h), self.text_color),
+                       origin, fill_mask))
+
+        layer = (bg_rect, pastes)
+        self._text_layer_cache[key] = layer
+        return layer
+
+    def _text_geometry(self, img_width: int, img_height: int,
+                       aspect_ratio: str) -> tuple:
+        """Cached text-layout constants for one canvas geometry.
+
+        Returns:
+            Tuple of (base_font_size, box_position, max_width, offset_factor)
+        """
+        key = (img_width, img_height, aspect_ratio)
+        geom = self._geom_cache.get(key)
+        if geom is not None:
+            return geom
+
+        # Calculate font size based on image resolution
+        base_font_size = int(self.font_size * (img_width / 1024))
+
+        # Get text position based on aspect ratio
+        text_zone = TEXT_POSITIONS.get(aspect_ratio, "bottom_third")
+        box_position = self._get_text_position(img_width, img_height, text_zone)
+
+        # 85% of image width for better margins
+        max_width = int(img_width * 0.85)
+
+        # Vertical nudge within the box (fraction of the text height)
         aspect = img_width / img_height
         if 0.9 <= aspect <= 1.1:  # 1:1 square
-            text_offset_adj = int(total_height * 0.17)  # Move text down 17% of text height
+            offset_factor = 0.17
         elif aspect < 0.9:  # 9:16 portrait
-            text_offset_adj = int(total_height * 0.22)  # Move text down 22% of text height
+            offset_factor = 0.22
         else:  # 16:9 landscape
-            text_offset_adj = int(total_height * 0.20)  # Move text down 20% of text height
-        
-        # Draw each line with centered anchor (using 'mm' = middle-middle)
-        y_offset = -(total_height // 2) + text_offset_adj
-        for i, line in enumerate(lines):
-            y_pos = box_position[1] + y_offset
-            
-            # Draw text with outline and proper center anchoring
-            self._draw_text_with_outline(
-                draw, line, (box_position[0], y_pos), font,
-                self.text_color, self.outline_color, self.outline_width,
-                anchor="mm"
-            )
-        
-            y_offset += line_heights[i] + line_spacing
-        
-        return img.convert('RGB')
-    
-    def _load_font_with_fallback(self, font_size: int) -> ImageFont.FreeTypeFont:
+            offset_factor = 0.20
+
+        geom = (base_font_size, box_position, max_width, offset_factor)
+        self._geom_cache[key] = geom
+        return geom
+
+    def _resolve_font_path(self) -> str:
         """
-        Load font with fallback chain.
-        
+        Resolve the font file once at init.
+
         Tries in order:
         1. Configured font path
         2. System fonts (Arial, Helvetica, DejaVu Sans)
-        3. PIL default font
+
+        Returns None when no usable font file exists (PIL default is used).
         """
-        # Try configured font
-        if os.path.exists(self.font_path):
-            try:
-                return ImageFont.truetype(self.font_path, font_size)
-            except Exception:
-                pass
-        
-        # Try common system fonts
-        system_fonts = [
+        candidates = [
+            self.font_path,
             '/System/Library/Fonts/Helvetica.ttc',  # macOS
             '/System/Library/Fonts/Supplemental/Arial.ttf',  # macOS
             'C:\\Windows\\Fonts\\arial.ttf',  # Windows
@@ -169,17 +309,28 @@ class AssetCompositor:
             '/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf',  # Linux
             '/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf',  # Linux
         ]
-        
-        for font_path in system_fonts:
+
+        for font_path in candidates:
             if os.path.exists(font_path):
                 try:
-                    return ImageFont.truetype(font_path, font_size)
+                    ImageFont.truetype(font_path, 10)
+                    return font_path
                 except Exception:
                     continue
-        
-        # Fallback to PIL default font
+
         print("Warning: Using PIL default font. Text may not render optimally.")
-        return ImageFont.load_default()
+        return None
+
+    def _load_font_with_fallback(self, font_size: int) -> ImageFont.FreeTypeFont:
+        """Return the cached FreeType face for a size, opening it on first use."""
+        if self._resolved_font_path is None:
+            return ImageFont.load_default()
+
+        font = self._font_cache.get(font_size)
+        if font is None:
+            font = ImageFont.truetype(self._resolved_font_path, font_size)
+            self._font_cache[font_size] = font
+        return font
     
     def _get_text_position(self, width: int, height: int, text_zone: str) -> Tuple[int, int]:
         """Get text position based on zone specification."""
@@ -204,107 +355,143 @@ class AssetCompositor:
         
         return (x, y)
     
-    def _wrap_text(self, text: str, font: ImageFont.FreeTypeFont, max_width: int) -> List[str]:
-        """Wrap text to fit within max_width, preserving words."""
-        words = text.split()
-        lines = []
-        current_line = []
-        
-        for word in words:
-            test_line = ' '.join(current_line + [word])
-            # Get text bounding box
-            bbox = font.getbbox(test_line)
-            text_width = bbox[2] - bbox[0]
-            
-            if text_width <= max_width:
-                current_line.append(word)
+    def _word_width(self, font: ImageFont.FreeTypeFont, word: str) -> float:
+        """Memoized advance width of a word (FreeType shaping is the hot cost)."""
+        key = (font, word)
+        width = self._word_widths.get(key)
+        if width is None:
+            width = font.getlength(word)
+            self._word_widths[key] = width
+        return width
+
+    def _wrap_text(self, text: str, font: ImageFont.FreeTypeFont,
+                   max_width: int) -> Tuple[List[str], List[float]]:
+        """Wrap text to fit within max_width, preserving words.
+
+        Measures while wrapping: each word is shaped once via getlength
+        (advance only — cheaper than getbbox) and line widths come out of
+        the same pass, so callers never re-measure finished lines.
+
+        Returns:
+            Tuple of (lines, line_widths)
+        """
+        space_width = self._word_width(font, ' ')
+        lines: List[str] = []
+        widths: List[float] = []
+        current: List[str] = []
+        current_width = 0.0
+
+        for word in text.split():
+            width = self._word_width(font, word)
+            test_width = current_width + (space_width if current else 0) + width
+
+            if test_width <= max_width or not current:
+                current.append(word)
+                current_width = test_width
             else:
-                if current_line:
-                    lines.append(' '.join(current_line))
-                current_line = [word]
-        
-        if current_line:
-            lines.append(' '.join(current_line))
-        
-        return lines if lines else [text]
+                lines.append(' '.join(current))
+                widths.append(current_width)
+                current = [word]
+                current_width = width
+
+        if current:
+            lines.append(' '.join(current))
+            widths.append(current_width)
+
+        if not lines:
+            return [text], [self._word_width(font, text)]
+        return lines, widths
     
     def _scale_font_to_fit(self, text: str, max_width: int, initial_size: int, max_lines: int = 3) -> ImageFont.FreeTypeFont:
-        """Dynamically scale font size to fit text within constraints."""
-        font_size = initial_size
+        """Scale font size down so text wraps within max_lines.
+
+        Advance widths scale linearly with font size, so one measurement
+        at the initial size solves the target analytically; a short
+        verification loop absorbs the slack lost at line breaks. The old
+        geometric 0.9x probe re-wrapped the text up to ~14 times.
+        """
         min_font_size = 20
-        
+        font = self._load_font_with_fallback(initial_size)
+        words = text.split()
+        space_width = self._word_width(font, ' ')
+        full_width = (
+            sum(self._word_width(font, word) for word in words)
+            + space_width * (len(words) - 1)
+        )
+
+        if full_width <= 0:
+            return font
+
+        font_size = int(initial_size * max_lines * max_width / full_width)
+        font_size = max(min_font_size, min(font_size, initial_size))
+
         while font_size > min_font_size:
             font = self._load_font_with_fallback(font_size)
-            lines = self._wrap_text(text, font, max_width)
-            
+            lines, _ = self._wrap_text(text, font, max_width)
+
             if len(lines) <= max_lines:
                 return font
-            
-            # Reduce font size by 10%
-            font_size = int(font_size * 0.9)
-        
+
+            # Off-by-a-line from wrapping slack: nudge down and recheck
+            font_size = max(min_font_size, int(font_size * 0.95))
+
         # Return minimum font size
         return self._load_font_with_fallback(min_font_size)
     
-    def _draw_text_with_outline(self, draw: ImageDraw.Draw, text: str,
-                               position: Tuple[int, int], font: ImageFont.FreeTypeFont,
-                               fill_color: str, outline_color: str, outline_width: int,
-                               anchor: str = "mm"):
-        """Draw text with outline for readability and proper centering."""
-        x, y = position
-        
-        # Draw outline (multiple passes for thicker outline)
-        for adj in range(-outline_width, outline_width + 1):
-            for adj2 in range(-outline_width, outline_width + 1):
-                if adj != 0 or adj2 != 0:
-                    draw.text((x + adj, y + adj2), text, font=font, fill=outline_color, anchor=anchor)
-        
-        # Draw main text with anchor for perfect centering
-        draw.text(position, text, font=font, fill=fill_color, anchor=anchor)
-    
+    def _prepare_logo(self, logo_path: str, logo_size: int) -> Image.Image:
+        """Decode, resize and fade the logo once per (path, size).
+
+        The finished RGBA tile is cached so the other ~N-1 assets in a
+        campaign skip the decode + LANCZOS + alpha work entirely.
+        """
+        key = (logo_path, logo_size)
+        logo = self._logo_cache.get(key)
+        if logo is not None:
+            return logo
+
+        # No verify()/reopen dance: open already rejects bad headers and
+        # decode errors surface in the caller's except — verify just
+        # doubled the I/O and invalidated the handle
+        logo = Image.open(logo_path)
+
+        # Big-ratio downscales: pre-reduce with the cheap BOX average to
+        # 2x target, then finish with LANCZOS — Pillow's documented
+        # recipe for large reductions; halves the filter-kernel work
+        if max(logo.size) > 4 * logo_size:
+            logo.thumbnail((logo_size * 2, logo_size * 2), Image.Resampling.BOX)
+        logo.thumbnail((logo_size, logo_size), Image.Resampling.LANCZOS)
+        if logo.mode != 'RGBA':
+            logo = logo.convert('RGBA')
+
+        # Apply opacity: point() runs one C pass through a 256-entry LUT,
+        # versus the Brightness enhancer's allocate+blend pipeline
+        if self.logo_opacity < 1.0:
+            opacity = self.logo_opacity
+            logo.putalpha(logo.getchannel('A').point(lambda v: int(v * opacity)))
+
+        self._logo_cache[key] = logo
+        return logo
+
     def _overlay_logo(self, img: Image.Image, aspect_ratio: str, logo_path: str) -> Image.Image:
         """Overlay brand logo on image."""
-        # Check if logo file exists and is valid
-        if not os.path.exists(logo_path):
-            return img
-        
         try:
-            # Try to open and verify it's a valid image
-            logo = Image.open(logo_path)
-            logo.verify()  # Verify the image file
-            logo = Image.open(logo_path)  # Reopen after verify() closes it
             img_width, img_height = img.size
-            
+
             # Resize logo (10% of image width by default)
             logo_size = int(img_width * self.logo_scale)
-            logo.thumbnail((logo_size, logo_size), Image.Resampling.LANCZOS)
-            
-            # Apply opacity
-            if self.logo_opacity < 1.0:
-                alpha = logo.split()[3] if logo.mode == 'RGBA' else None
-                if alpha:
-                    alpha = ImageEnhance.Brightness(alpha).enhance(self.logo_opacity)
-                    logo.putalpha(alpha)
-                else:
-                    logo = logo.convert('RGBA')
-                    alpha = logo.split()[3]
-                    alpha = ImageEnhance.Brightness(alpha).enhance(self.logo_opacity)
-                    logo.putalpha(alpha)
-            
+            logo = self._prepare_logo(logo_path, logo_size)
+
             # Get logo position
             logo_x, logo_y = self._get_logo_position(
                 img_width, img_height, logo.width, logo.height, self.logo_position
             )
-            
-            # Paste logo on image
-            if logo.mode == 'RGBA':
-                img.paste(logo, (logo_x, logo_y), logo)
-            else:
-                img.paste(logo, (logo_x, logo_y))
-            
+
+            # Paste logo on image (cached tile is always RGBA)
+            img.paste(logo, (logo_x, logo_y), logo)
+
         except Exception as e:
             print(f"Warning: Could not overlay logo: {e}")
-        
+
         return img
     
     def _get_logo_position(self, img_width: int, img_height: int,
@@ -4,9 +4,53 @@ from typing import Dict, List, Tuple, Optional
 from PIL import Image
 import numpy as np
 from pathlib import Path
+import hashlib
 import os
+import re
 import json
-from openai import OpenAI
+from src.openai_client import get_openai_client
+from src.utils import load_json, save_json
+
+# Optional numba JIT for the per-pixel palette-distance kernel; the
+# numpy broadcast fallback is fine at thumbnail resolution.
+try:
+    import numba
+    _HAS_NUMBA = True
+except ImportError:
+    numba = None
+    _HAS_NUMBA = False
+
+
+def _coverage_numpy(img_u8: np.ndarray, palette: np.ndarray, tol: int) -> float:
+    """Fraction of pixels within tol (per-channel RMS) of any palette color."""
+    diff = img_u8[:, :, None, :].astype(np.int32) - palette[None, None, :, :]
+    min_d2 = (diff * diff).sum(axis=-1).min(axis=-1)
+    return float((min_d2 <= 3 * tol * tol).mean())
+
+
+if _HAS_NUMBA:
+    @numba.njit(parallel=True, cache=True)
+    def _coverage_jit(img_u8, palette, tol):  # pragma: no cover - needs numba
+        height, width, _ = img_u8.shape
+        threshold = 3 * tol * tol
+        hits = 0
+        for i in numba.prange(height):
+            for j in range(width):
+                best = 1 << 30
+                for k in range(palette.shape[0]):
+                    dr = np.int32(img_u8[i, j, 0]) - palette[k, 0]
+                    dg = np.int32(img_u8[i, j, 1]) - palette[k, 1]
+                    db = np.int32(img_u8[i, j, 2]) - palette[k, 2]
+                    d2 = dr * dr + dg * dg + db * db
+                    if d2 < best:
+                        best = d2
+                if best <= threshold:
+                    hits += 1
+        return hits / (height * width)
+
+    _brand_color_coverage = _coverage_jit
+else:
+    _brand_color_coverage = _coverage_numpy
 
 
 class ComplianceResult:
@@ -56,6 +100,12 @@ class GovernanceEngine:
         self.prohibited_terms = set(
             term.lower() for term in self.governance_config.get('prohibited_terms', [])
         )
+        # One compiled alternation scans the message in a single pass
+        # instead of one substring search per term; longest-first so
+        # overlapping terms report the full match
+        self._term_pattern = re.compile(
+            '|'.join(map(re.escape, sorted(self.prohibited_terms, key=len, reverse=True)))
+        ) if self.prohibited_terms else None
         
         # Load prohibited categories (configurable)
         self.prohibited_categories = self.governance_config.get('prohibited_categories', [
@@ -64,8 +114,18 @@ class GovernanceEngine:
             'sexual content'
         ])
         
-        # Brand color palette for validation
+        # Brand color palette for validation (parsed once to an int array
+        # for the coverage kernel; malformed entries are skipped)
         self.brand_colors = self.brand_config.get('brand_colors', [])
+        palette = []
+        for color in self.brand_colors:
+            hex_str = color.lstrip('#')
+            if len(hex_str) == 6:
+                try:
+                    palette.append([int(hex_str[i:i + 2], 16) for i in (0, 2, 4)])
+                except ValueError:
+                    continue
+        self._palette = np.array(palette, dtype=np.int32) if palette else None
         
         # Logo path for brand compliance
         self.logo_path = self.brand_config.get('logo_path', 'assets/brand/logo.png')
@@ -73,10 +133,19 @@ class GovernanceEngine:
         # LLM validation setup
         if self.governance_config.get('llm_validation_enabled', True):
             api_key = config.get('generator', {}).get('api_key') or os.getenv('OPENAI_API_KEY')
-            self.llm_client = OpenAI(api_key=api_key) if api_key else None
+            # Shared with ImageGenerator — one connection pool per key
+            self.llm_client = get_openai_client(api_key) if api_key else None
             self.llm_model = self.governance_config.get('llm_validation_model', 'gpt-4o-mini')
         else:
             self.llm_client = None
+
+        # Persistent cache of LLM validation verdicts keyed by brief
+        # content hash — re-running an unchanged brief should not pay
+        # seconds of latency (and real money) for the same answer
+        self._validation_cache_path = Path(
+            self.governance_config.get('validation_cache', 'cache/validation_cache.json')
+        )
+        self._validation_cache: Optional[Dict[str, Dict]] = None
     
     def check_asset(self, image: Image.Image, campaign_message: str, 
                    product_id: str) -> ComplianceResult:
@@ -92,27 +161,37 @@ class GovernanceEngine:
             ComplianceResult with findings
         """
         result = ComplianceResult()
-        
+        fail_fast = self.governance_config.get('fail_fast', True)
+
+        # Cheap checks first (string scan, metadata reads); a hard error
+        # here short-circuits anything that would touch pixel buffers,
+        # since a rejected asset never ships anyway.
         # Legal compliance
         if self.governance_config.get('legal_check_enabled', True):
             self._check_legal_terms(campaign_message, result)
-        
+            if fail_fast and not result.passed:
+                return result
+
         # Brand compliance
         if self.governance_config.get('brand_check_enabled', True):
-            self._check_brand_presence(image, result)
             self._check_image_quality(image, result)
-        
+            if fail_fast and not result.passed:
+                return result
+            self._check_brand_presence(image, result)
+
         # Content safety
         if self.governance_config.get('content_safety_enabled', False):
             self._check_content_safety(image, result)
-        
+
         return result
     
     def _check_legal_terms(self, text: str, result: ComplianceResult):
         """Check for prohibited legal terms."""
-        text_lower = text.lower()
-        found_terms = [term for term in self.prohibited_terms if term in text_lower]
-        
+        found_terms = (
+            sorted(set(self._term_pattern.findall(text.lower())))
+            if self._term_pattern else []
+        )
+
         if found_terms:
             result.add_error(f"Prohibited terms found: {', '.join(found_terms)}")
         else:
@@ -160,14 +239,27 @@ class GovernanceEngine:
         if not self.brand_colors:
             return True, ["No brand colors configured"]
         
-        # Simplified check: ensure image isn't monochrome
-        img_array = np.array(image.convert('RGB'))
-        std_dev = img_array.std()
-        
+        # Simplified check: ensure image isn't monochrome. A 128px
+        # NEAREST subsample preserves the pixel distribution (an
+        # averaging filter would shrink the std) while touching ~64x
+        # less memory than the full-resolution array.
+        thumb = image.resize((128, 128), Image.Resampling.NEAREST).convert('RGB')
+        arr = np.asarray(thumb, dtype=np.uint8)
+        std_dev = arr.std()
+
         if std_dev < 10:
             return False, ["Image appears monochrome - brand colors not evident"]
-        
-        return True, ["Color variance acceptable"]
+
+        messages = ["Color variance acceptable"]
+
+        # Informational: how much of the frame sits near the configured
+        # palette (JIT-compiled per-pixel loop when numba is installed,
+        # numpy broadcast otherwise — both run on the small thumbnail)
+        if self._palette is not None:
+            coverage = _brand_color_coverage(arr, self._palette, 32)
+            messages.append(f"Brand color coverage: {coverage * 100:.0f}%")
+
+        return True, messages
     
     def validate_campaign_brief(self, brief) -> Dict:
         """
@@ -181,7 +273,19 @@ class GovernanceEngine:
         """
         if not self.llm_client:
             return {'passed': True, 'errors': [], 'warnings': ['LLM validation disabled'], 'suggestions': []}
-        
+
+        # Identical briefs get the cached verdict instead of another call
+        cache_key = self._brief_cache_key(brief)
+        if self._validation_cache is None:
+            try:
+                self._validation_cache = load_json(self._validation_cache_path) \
+                    if self._validation_cache_path.exists() else {}
+            except (ValueError, OSError):
+                self._validation_cache = {}
+        cached = self._validation_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         # Build validation prompt with prohibited categories
         prohibited_list = ", ".join(self.prohibited_categories)
         
@@ -222,9 +326,18 @@ Errors = blocking issues that prevent generation. Warnings = proceed with cautio
             # Apply blocking behavior if configured
             if self.governance_config.get('validation_blocking', True) and result.get('errors'):
                 result['passed'] = False
-            
+
+            # Only successful verdicts are cached; transient API failures
+            # below should retry on the next run
+            self._validation_cache[cache_key] = result
+            try:
+                self._validation_cache_path.parent.mkdir(parents=True, exist_ok=True)
+                save_json(self._validation_cache, self._validation_cache_path)
+            except OSError:
+                pass
+
             return result
-            
+
         except Exception as e:
             return {
                 'passed': False,
@@ -233,6 +346,25 @@ Errors = blocking issues that prevent generation. Warnings = proceed with cautio
                 'suggestions': []
             }
     
+    def _brief_cache_key(self, brief) -> str:
+        """Content hash over every field the validation prompt depends on."""
+        payload = {
+            'id': brief.campaign_id,
+            'msg': brief.campaign_message,
+            'aud': brief.target_audience,
+            'region': brief.region,
+            'products': [
+                (p.name, p.description, p.creative_brief.setting,
+                 p.creative_brief.mood, p.brand_style.visual_style)
+                for p in brief.products
+            ],
+            'prohibited': sorted(self.prohibited_categories),
+            'model': self.llm_model,
+        }
+        return hashlib.sha256(
+            json.dumps(payload, sort_keys=True).encode()
+        ).hexdigest()
+
     def _format_products_for_validation(self, products) -> str:
         """Format products for LLM validation."""
         lines = []
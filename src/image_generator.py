@@ -2,14 +2,24 @@
 
 import os
 import time
-import requests
-from typing import Optional, Tuple, Dict, Any
+import asyncio
+from functools import lru_cache
+# The installed openai SDK declares httpx2 (a renamed httpx
+# distribution) rather than httpx, so only one of the two is present
+# depending on the environment; accept either
+try:
+    import httpx
+except ImportError:
+    import httpx2 as httpx
+from typing import List, Optional, Tuple, Dict, Any
 from PIL import Image
 from io import BytesIO
-from openai import OpenAI
+from openai import AsyncOpenAI
 from openai import RateLimitError, APIError, APIConnectionError
 
 from src.models import Product, CampaignBrief
+from src.openai_client import get_openai_client, get_http_session
+from src.utils import RateLimiter
 
 
 # DALL-E 3 pricing (as of 2024)
@@ -19,12 +29,106 @@ COST_PER_IMAGE = {
 }
 
 
+# Lighting picked by first keyword hit in setting, then mood
+_STUDIO_LIGHTING = "professional studio lighting with softbox, subtle rim light, minimal shadows, f/2.8"
+_NATURAL_LIGHTING = "natural window light at golden hour, soft ambient fill, organic shadows, f/4"
+_DRAMATIC_LIGHTING = "dramatic side lighting with Profoto strobes, depth and dimension, f/2.8"
+_DEFAULT_LIGHTING = "natural diffused daylight through large windows, soft shadows, f/3.5"
+
+_LIGHTING_RULES = (
+    ('setting', 'studio', _STUDIO_LIGHTING),
+    ('setting', 'minimal', _STUDIO_LIGHTING),
+    ('setting', 'natural', _NATURAL_LIGHTING),
+    ('setting', 'eco', _NATURAL_LIGHTING),
+    ('mood', 'dramatic', _DRAMATIC_LIGHTING),
+    ('mood', 'bold', _DRAMATIC_LIGHTING),
+)
+
+
+@lru_cache(maxsize=256)
+def _hero_prompt(name: str, description: str, setting: str, mood: str,
+                 elements: tuple, palette: tuple, visual_style: str,
+                 target_audience: str) -> str:
+    """Assemble the hero prompt once per distinct product/audience tuple.
+
+    Retries and repeat runs of the same brief hand back the cached string
+    instead of re-lowercasing the config fields and re-joining the
+    template.
+    """
+    setting_lower = setting.lower()
+    mood_lower = mood.lower()
+
+    lighting = _DEFAULT_LIGHTING
+    for field, keyword, value in _LIGHTING_RULES:
+        haystack = setting_lower if field == 'setting' else mood_lower
+        if keyword in haystack:
+            lighting = value
+            break
+
+    return f"""PHOTOREALISTIC PRODUCT PHOTOGRAPHY - Commercial advertising shoot
+
+SUBJECT: {name}
+{description}
+
+CAMERA SETUP:
+- Professional DSLR/mirrorless camera (Canon EOS R5 or Sony A7R IV quality)
+- 85mm prime lens for natural perspective
+- {lighting}
+- Shot on actual camera, NOT AI-generated or CGI
+
+COMPOSITION (CRITICAL):
+- Product perfectly centered in frame, occupying 60-70% of image
+- Generous negative space on all sides for safe cropping to 1:1, 9:16, and 16:9
+- Clean, uncluttered {setting}
+- Include: {", ".join(elements)}
+
+STYLING & MOOD:
+- {mood} atmosphere
+- Brand colors: {", ".join(palette)}
+- Visual style: {visual_style}
+- Target: {target_audience}
+
+REALISM DIRECTIVES:
+- Real photography aesthetic with subtle lens characteristics
+- Natural depth of field with bokeh
+- Authentic product textures and materials
+- Subtle reflections and environmental interactions
+- NO artificial perfection, NO generic stock photo look
+- Preserve natural lighting imperfections and subtle shadows
+- Professional commercial advertising quality
+- Think Apple, Nike, or premium magazine editorial
+
+AVOID: Oversaturation, artificial lighting, CGI appearance, symmetrical perfection, generic angles"""
+
+
+def _parse_reset(value: Optional[str]) -> Optional[float]:
+    """Parse an x-ratelimit-reset-requests value ('250ms', '1.5s') to seconds."""
+    if not value:
+        return None
+    try:
+        if value.endswith('ms'):
+            return float(value[:-2]) / 1000.0
+        if value.endswith('s'):
+            return float(value[:-1])
+        return float(value)
+    except ValueError:
+        return None
+
+
 class ImageGenerator:
     """Generate hero images using OpenAI DALL-E 3 API with integrated prompting."""
     
-    def __init__(self, config: dict):
-        """Initialize image generator with configuration."""
+    def __init__(self, config: dict, rate_limiter: Optional[RateLimiter] = None):
+        """Initialize image generator with configuration.
+
+        Args:
+            config: Full application configuration
+            rate_limiter: Shared limiter to feed with the rate-limit
+                headers from each response, so pacing tracks the server's
+                actual remaining budget instead of the static config limit
+        """
         self.config = config
+        self.rate_limiter = rate_limiter
         generator_config = config.get('generator', {})
         self.model = generator_config.get('model', 'dall-e-3')
         self.api_key = generator_config.get('api_key') or os.getenv('OPENAI_API_KEY')
@@ -38,7 +142,11 @@ class ImageGenerator:
         if not self.api_key:
             raise ValueError("OpenAI API key not found. Set OPENAI_API_KEY environment variable.")
         
-        self.client = OpenAI(api_key=self.api_key)
+        # Shared per-key client and session (see src.openai_client): keeps
+        # connection pools warm across components and campaign reruns
+        self.client = get_openai_client(self.api_key)
+        self._session = get_http_session()
+        self.async_client = AsyncOpenAI(api_key=self.api_key)
     
     def generate_hero(self, product: Product, campaign_brief: CampaignBrief) -> Tuple[Image.Image, float]:
         """
@@ -62,82 +170,153 @@ class ImageGenerator:
         
         return image, cost
     
-    def _build_hero_prompt(self, product: Product, campaign_brief: CampaignBrief) -> str:
+    async def generate_hero_async(self, product: Product,
+                                  campaign_brief: CampaignBrief) -> Tuple[Image.Image, float]:
         """
-        Build a photorealistic hero image prompt optimized for multi-format cropping.
-        
-        Focus: Center-weighted composition with generous negative space and realistic photography.
+        Async counterpart of generate_hero.
+
+        DALL-E latency is 10-30s of pure waiting; awaiting the call frees
+        the event loop instead of parking a worker thread.
+
+        Args:
+            product: Product model with details and creative brief
+            campaign_brief: Campaign brief with region and audience
+
+        Returns:
+            Tuple of (PIL Image, cost)
         """
-        # Determine photography style based on setting and mood
-        setting_lower = product.creative_brief.setting.lower()
-        mood_lower = product.creative_brief.mood.lower()
-        
-        # Select lighting description
-        if "studio" in setting_lower or "minimal" in setting_lower:
-            lighting = "professional studio lighting with softbox, subtle rim light, minimal shadows, f/2.8"
-        elif "natural" in setting_lower or "eco" in setting_lower:
-            lighting = "natural window light at golden hour, soft ambient fill, organic shadows, f/4"
-        elif "dramatic" in mood_lower or "bold" in mood_lower:
-            lighting = "dramatic side lighting with Profoto strobes, depth and dimension, f/2.8"
-        else:
-            lighting = "natural diffused daylight through large windows, soft shadows, f/3.5"
-        
-        # Build photorealistic hero prompt
-        prompt = f"""PHOTOREALISTIC PRODUCT PHOTOGRAPHY - Commercial advertising shoot
+        prompt = self._build_hero_prompt(product, campaign_brief)
 
-SUBJECT: {product.name}
-{product.description[:180]}
+        async with httpx.AsyncClient(timeout=60) as http:
+            image = await self._call_api_with_retry_async(prompt, self.hero_size, http)
 
-CAMERA SETUP:
-- Professional DSLR/mirrorless camera (Canon EOS R5 or Sony A7R IV quality)
-- 85mm prime lens for natural perspective
-- {lighting}
-- Shot on actual camera, NOT AI-generated or CGI
+        cost = COST_PER_IMAGE.get(self.quality, 0.08)
+        return image, cost
 
-COMPOSITION (CRITICAL):
-- Product perfectly centered in frame, occupying 60-70% of image
-- Generous negative space on all sides for safe cropping to 1:1, 9:16, and 16:9
-- Clean, uncluttered {product.creative_brief.setting}
-- Include: {", ".join(product.creative_brief.key_visual_elements[:3])}
+    async def generate_batch(self, products: List[Product],
+                             campaign_brief: CampaignBrief) -> List[Tuple[Image.Image, float]]:
+        """
+        Generate heroes for many products concurrently.
 
-STYLING & MOOD:
-- {product.creative_brief.mood} atmosphere
-- Brand colors: {", ".join(product.brand_style.color_palette[:3])}
-- Visual style: {product.brand_style.visual_style}
-- Target: {campaign_brief.target_audience}
+        Wall clock for N products approaches one API latency instead of N
+        (subject to API rate limits). Downloads share one pooled client.
 
-REALISM DIRECTIVES:
-- Real photography aesthetic with subtle lens characteristics
-- Natural depth of field with bokeh
-- Authentic product textures and materials
-- Subtle reflections and environmental interactions
-- NO artificial perfection, NO generic stock photo look
-- Preserve natural lighting imperfections and subtle shadows
-- Professional commercial advertising quality
-- Think Apple, Nike, or premium magazine editorial
+        Returns:
+            List of (PIL Image, cost) tuples, in product order
+        """
+        async with httpx.AsyncClient(timeout=60) as http:
+            return list(await asyncio.gather(*(
+                self._generate_one_async(product, campaign_brief, http)
+                for product in products
+            )))
 
-AVOID: Oversaturation, artificial lighting, CGI appearance, symmetrical perfection, generic angles"""
+    async def _generate_one_async(self, product: Product, campaign_brief: CampaignBrief,
+                                  http: httpx.AsyncClient) -> Tuple[Image.Image, float]:
+        """Generate a single hero against a shared HTTP client."""
+        prompt = self._build_hero_prompt(product, campaign_brief)
+        image = await self._call_api_with_retry_async(prompt, self.hero_size, http)
+        return image, COST_PER_IMAGE.get(self.quality, 0.08)
+
+    async def _call_api_with_retry_async(self, prompt: str, size: str,
+                                         http: httpx.AsyncClient) -> Image.Image:
+        """Async API call with iterative exponential backoff.
+
+        Backoff awaits the loop instead of time.sleep, and the loop form
+        avoids the recursion-depth growth of the sync path's retries.
+        """
+        last_error = None
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                raw = await self.async_client.images.with_raw_response.generate(
+                    model=self.model,
+                    prompt=prompt,
+                    size=size,
+                    quality="hd" if self.quality == "hd" else "standard",
+                    n=1
+                )
+                self._record_rate_headers(raw.headers)
+                response = raw.parse()
+
+                image_url = response.data[0].url
+                img_response = await http.get(image_url)
+                img_response.raise_for_status()
+
+                image = Image.open(BytesIO(img_response.content))
+                image.load()
+                return image
+
+            except (RateLimitError, APIError, APIConnectionError) as e:
+                last_error = e
+                if attempt < self.max_retries:
+                    await asyncio.sleep(2 ** attempt)
+            except Exception as e:
+                raise Exception(f"Image generation failed: {e}")
+
+        raise Exception(f"API error after {self.max_retries} retries: {last_error}")
 
-        return prompt
+    def _record_rate_headers(self, headers):
+        """Feed the response's rate-limit headers into the shared limiter."""
+        if self.rate_limiter is None:
+            return
+        remaining = headers.get('x-ratelimit-remaining-requests')
+        try:
+            remaining = int(remaining) if remaining is not None else None
+        except ValueError:
+            remaining = None
+        self.rate_limiter.update(
+            remaining_requests=remaining,
+            reset_seconds=_parse_reset(headers.get('x-ratelimit-reset-requests'))
+        )
+
+    def _build_hero_prompt(self, product: Product, campaign_brief: CampaignBrief) -> str:
+        """
+        Build a photorealistic hero image prompt optimized for multi-format cropping.
+
+        Focus: Center-weighted composition with generous negative space and
+        realistic photography. Delegates to a memoized pure function keyed
+        on the product fields, so retries reuse the assembled string.
+        """
+        return _hero_prompt(
+            product.name,
+            product.description[:180],
+            product.creative_brief.setting,
+            product.creative_brief.mood,
+            tuple(product.creative_brief.key_visual_elements[:3]),
+            tuple(product.brand_style.color_palette[:3]),
+            product.brand_style.visual_style,
+            campaign_brief.target_audience
+        )
     
     def _call_api_with_retry(self, prompt: str, size: str, retry_count: int = 0) -> Image.Image:
         """Call OpenAI API with exponential backoff retry logic."""
         try:
-            response = self.client.images.generate(
+            raw = self.client.images.with_raw_response.generate(
                 model=self.model,
                 prompt=prompt,
                 size=size,
                 quality="hd" if self.quality == "hd" else "standard",
                 n=1
             )
-            
-            # Download image from URL
+            self._record_rate_headers(raw.headers)
+            response = raw.parse()
+
+            # Download image from URL, streaming chunks into one buffer.
+            # Pillow needs a seekable stream, so response.raw can't feed
+            # the decoder directly — but filling a single BytesIO avoids
+            # the .content bytes + BytesIO copy that doubled peak memory.
             image_url = response.data[0].url
-            img_response = requests.get(image_url)
+            img_response = self._session.get(image_url, stream=True, timeout=60)
             img_response.raise_for_status()
-            
-            # Convert to PIL Image
-            image = Image.open(BytesIO(img_response.content))
+
+            buffer = BytesIO()
+            for chunk in img_response.iter_content(chunk_size=1 << 16):
+                buffer.write(chunk)
+            buffer.seek(0)
+
+            # Convert to PIL Image (decode eagerly so the buffer can go)
+            image = Image.open(buffer)
+            image.load()
             return image
             
         except RateLimitError as e:
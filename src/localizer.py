@@ -1,10 +1,17 @@
 """Localization and translation for campaign messages."""
 
+import asyncio
+import hashlib
 import os
-from typing import Dict, Optional
-from openai import OpenAI
+import random
+import re
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from openai import AsyncOpenAI, OpenAI
+from openai import RateLimitError, APIError, APIConnectionError
 
-from src.utils import Config
+from src.utils import Config, load_json, save_json
 
 
 # Region to language mapping
@@ -34,8 +41,48 @@ class Localizer:
             raise ValueError("OpenAI API key not found. Set OPENAI_API_KEY environment variable.")
         
         self.client = OpenAI(api_key=api_key)
-        self.translation_cache: Dict[str, str] = {}
-    
+        self.async_client = AsyncOpenAI(api_key=api_key)
+        self.max_concurrent_requests = localization_config.get('max_concurrent_requests', 8)
+        self.max_retries = localization_config.get('max_retries', 3)
+
+        # Translations persist across runs: identical briefs would
+        # otherwise pay the full GPT call again for the same strings.
+        # Entries are keyed by a hash of (model, locale, text) so a
+        # model change naturally invalidates old translations.
+        self.cache_ttl = localization_config.get('cache_ttl', 2592000)  # 30 days
+        self.cache_path = Path(localization_config.get('cache_path', 'cache/translations.json'))
+        self._disk_entries: Dict[str, Dict] = {}
+        if self.cache_path.exists():
+            try:
+                entries = load_json(self.cache_path)
+            except (ValueError, OSError):
+                entries = {}
+            cutoff = time.time() - self.cache_ttl
+            self._disk_entries = {
+                key: entry for key, entry in entries.items()
+                if entry.get('ts', 0) >= cutoff
+            }
+        self.translation_cache: Dict[str, str] = {
+            key: entry['text'] for key, entry in self._disk_entries.items()
+        }
+
+    def _cache_key(self, message: str, target_locale: str) -> str:
+        """Stable cache key over everything the translation depends on."""
+        return hashlib.sha256(
+            f"{self.translation_model}|{target_locale}|{message}".encode()
+        ).hexdigest()
+
+    def _persist(self, entries: Dict[str, str]):
+        """Write new translations through to the on-disk cache."""
+        now = time.time()
+        for key, text in entries.items():
+            self._disk_entries[key] = {'text': text, 'ts': now}
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            save_json(self._disk_entries, self.cache_path)
+        except OSError:
+            pass
+
     def localize_message(self, message: str, target_locale: str, region: str) -> str:
         """
         Localize campaign message to target locale.
@@ -56,45 +103,243 @@ class Localizer:
             return message
         
         # Check cache
-        cache_key = f"{message}_{target_locale}"
+        cache_key = self._cache_key(message, target_locale)
         if cache_key in self.translation_cache:
             return self.translation_cache[cache_key]
-        
+
         # Translate using GPT-4
-        translated = self._translate(message, target_locale, region)
-        
-        # Cache translation
+        try:
+            translated = self._translate(message, target_locale, region)
+        except Exception as e:
+            print(f"Translation failed: {e}. Using original text.")
+            # Memory-only so the next run retries instead of persisting
+            # the untranslated fallback
+            self.translation_cache[cache_key] = message
+            return message
+
+        # Cache translation (and write through to disk)
         self.translation_cache[cache_key] = translated
-        
+        self._persist({cache_key: translated})
+
         return translated
-    
+
+    def prebuild_cache(self, messages: List[str], locales: List[str]):
+        """
+        Warm the translation cache with one batched call per locale.
+
+        Per-asset translation pays one chat-completion round trip per
+        (message, locale) pair; batching the distinct messages for a
+        locale into a single numbered list collapses that to one round
+        trip per locale. localize_message then reads pure cache hits.
+
+        Args:
+            messages: Campaign messages to translate
+            locales: Target locale codes
+        """
+        if not self.enabled:
+            return
+
+        for locale, pending in self._pending_by_locale(messages, locales):
+            try:
+                translations = self._translate_batch(pending, locale)
+            except Exception as e:
+                print(f"Batch translation failed: {e}. Using original text.")
+                self._cache_fallbacks(pending, locale)
+                continue
+
+            self._cache_translations(pending, locale, translations)
+
+    async def prebuild_cache_async(self, messages: List[str], locales: List[str]):
+        """
+        Async variant of prebuild_cache: the per-locale batched calls run
+        concurrently on the event loop, gated by a semaphore, so warming
+        L locales costs one API latency instead of L. Translation is pure
+        waiting — an event loop holds many in-flight requests where the
+        thread pool capped out at max_workers blocked threads.
+        """
+        if not self.enabled:
+            return
+
+        targets = self._pending_by_locale(messages, locales)
+        if not targets:
+            return
+
+        semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+
+        async def translate_locale(locale: str, pending: List[str]):
+            async with semaphore:
+                try:
+                    translations = await self._translate_batch_async(pending, locale)
+                except Exception as e:
+                    print(f"Batch translation failed: {e}. Using original text.")
+                    self._cache_fallbacks(pending, locale)
+                    return
+            self._cache_translations(pending, locale, translations)
+
+        await asyncio.gather(*(
+            translate_locale(locale, pending) for locale, pending in targets
+        ))
+
+    def _pending_by_locale(self, messages: List[str],
+                           locales: List[str]) -> List[Tuple[str, List[str]]]:
+        """Distinct messages still missing from the cache, per locale."""
+        unique_messages = list(dict.fromkeys(messages))
+        targets = []
+        for locale in locales:
+            if locale in (self.default_locale, 'en'):
+                continue
+            pending = [
+                message for message in unique_messages
+                if self._cache_key(message, locale) not in self.translation_cache
+            ]
+            if pending:
+                targets.append((locale, pending))
+        return targets
+
+    def _cache_translations(self, messages: List[str], locale: str,
+                            translations: List[str]):
+        """Store successful translations in memory and on disk."""
+        entries = {
+            self._cache_key(message, locale): translated
+            for message, translated in zip(messages, translations)
+        }
+        self.translation_cache.update(entries)
+        self._persist(entries)
+
+    def _cache_fallbacks(self, messages: List[str], locale: str):
+        """Memory-only originals after a failure, so the next run retries."""
+        for message in messages:
+            self.translation_cache[self._cache_key(message, locale)] = message
+
+    def _batch_request(self, texts: List[str], target_lang: str) -> Dict:
+        """Shared kwargs for the numbered-list batch completion."""
+        numbered = "\n".join(f"{i}. {text}" for i, text in enumerate(texts, 1))
+        return {
+            'model': self.translation_model,
+            'messages': [
+                {
+                    "role": "system",
+                    "content": (
+                        f"You are a professional marketing translator. Translate each "
+                        f"numbered campaign message to {target_lang}. Maintain brand tone "
+                        f"and marketing impact. Keep each concise and impactful. Respond "
+                        f"with the same numbered list, one translation per line, and no "
+                        f"other text."
+                    )
+                },
+                {
+                    "role": "user",
+                    "content": numbered
+                }
+            ],
+            'temperature': 0.3,
+            'max_tokens': 200 * len(texts)
+        }
+
+    @staticmethod
+    def _parse_numbered(content: str, texts: List[str]) -> List[str]:
+        """Map a numbered response back onto the input order."""
+        parsed = {
+            int(index): translation.strip()
+            for index, translation in re.findall(r'^\s*(\d+)[.)]\s*(.+)$', content, re.MULTILINE)
+        }
+        # Any line the model dropped falls back to the original text
+        return [parsed.get(i) or text for i, text in enumerate(texts, 1)]
+
+    @staticmethod
+    def _retryable(error: Exception) -> bool:
+        """Rate limits (429) and server/connection errors are worth retrying;
+        4xx request errors are fatal and should fall back immediately."""
+        status = getattr(error, 'status_code', None)
+        if status is None:
+            return True  # connection errors carry no status
+        return status == 429 or status >= 500
+
+    def _retry_delay(self, error: Exception, attempt: int) -> float:
+        """Sleep suggested by the API's rate-limit headers, else jittered
+        exponential backoff."""
+        headers = getattr(getattr(error, 'response', None), 'headers', None)
+        if headers is not None:
+            for header in ('retry-after', 'x-ratelimit-reset-requests'):
+                value = headers.get(header)
+                if value:
+                    delay = self._parse_reset(value)
+                    if delay is not None:
+                        return delay
+        return random.uniform(0, 2 ** attempt)
+
+    @staticmethod
+    def _parse_reset(value: str) -> Optional[float]:
+        """Parse header durations like '20', '1.5s' or '250ms' to seconds."""
+        try:
+            if value.endswith('ms'):
+                return float(value[:-2]) / 1000
+            if value.endswith('s'):
+                return float(value[:-1])
+            return float(value)
+        except ValueError:
+            return None
+
+    def _create_with_retries(self, request: Dict):
+        """Sync completion call with 429/5xx-aware exponential backoff."""
+        last_error = None
+        for attempt in range(self.max_retries + 1):
+            try:
+                return self.client.chat.completions.create(**request)
+            except (RateLimitError, APIError, APIConnectionError) as e:
+                if not self._retryable(e):
+                    raise
+                last_error = e
+                if attempt < self.max_retries:
+                    time.sleep(self._retry_delay(e, attempt))
+        raise last_error
+
+    async def _create_with_retries_async(self, request: Dict):
+        """Async twin of _create_with_retries (awaits the backoff)."""
+        last_error = None
+        for attempt in range(self.max_retries + 1):
+            try:
+                return await self.async_client.chat.completions.create(**request)
+            except (RateLimitError, APIError, APIConnectionError) as e:
+                if not self._retryable(e):
+                    raise
+                last_error = e
+                if attempt < self.max_retries:
+                    await asyncio.sleep(self._retry_delay(e, attempt))
+        raise last_error
+
+    def _translate_batch(self, texts: List[str], target_lang: str) -> List[str]:
+        """Translate several texts in one numbered-list completion."""
+        response = self._create_with_retries(self._batch_request(texts, target_lang))
+        return self._parse_numbered(response.choices[0].message.content, texts)
+
+    async def _translate_batch_async(self, texts: List[str], target_lang: str) -> List[str]:
+        """Async twin of _translate_batch (awaits instead of blocking)."""
+        response = await self._create_with_retries_async(self._batch_request(texts, target_lang))
+        return self._parse_numbered(response.choices[0].message.content, texts)
+
     def _translate(self, text: str, target_lang: str, region: str) -> str:
         """Translate text to target language using GPT-4."""
         if target_lang == 'en':
             return text
-        
-        try:
-            response = self.client.chat.completions.create(
-                model=self.translation_model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": f"You are a professional marketing translator. Translate the following campaign message to {target_lang}. Maintain brand tone and marketing impact. Keep it concise and impactful."
-                    },
-                    {
-                        "role": "user",
-                        "content": text
-                    }
-                ],
-                temperature=0.3,
-                max_tokens=200
-            )
-            
-            return response.choices[0].message.content.strip()
-        
-        except Exception as e:
-            print(f"Translation failed: {e}. Using original text.")
-            return text
+
+        response = self._create_with_retries({
+            'model': self.translation_model,
+            'messages': [
+                {
+                    "role": "system",
+                    "content": f"You are a professional marketing translator. Translate the following campaign message to {target_lang}. Maintain brand tone and marketing impact. Keep it concise and impactful."
+                },
+                {
+                    "role": "user",
+                    "content": text
+                }
+            ],
+            'temperature': 0.3,
+            'max_tokens': 200
+        })
+
+        return response.choices[0].message.content.strip()
     
     def get_locale_from_region(self, region: str) -> str:
         """Get default locale for a region."""
@@ -1,6 +1,6 @@
 """Data models for Prism campaign pipeline using Pydantic for validation."""
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field
 from typing import List, Optional, Dict, Any
 from enum import Enum
 
@@ -28,6 +28,8 @@ class CreativeBrief(BaseModel):
 
 class Product(BaseModel):
     """Product information and creative brief."""
+    # The pattern keeps IDs filesystem-safe; pydantic-core matches it as
+    # a compiled regex, so no Python-level validator is needed on top
     id: str = Field(..., pattern=r'^[a-z0-9_]+$')
     name: str = Field(..., min_length=1, max_length=100)
     description: str = Field(..., min_length=10, max_length=500)
@@ -35,17 +37,10 @@ class Product(BaseModel):
     creative_brief: CreativeBrief
     brand_style: BrandStyle
 
-    @field_validator('id')
-    @classmethod
-    def validate_id(cls, v: str) -> str:
-        """Ensure product ID is filesystem-safe."""
-        if not v.replace('_', '').replace('-', '').isalnum():
-            raise ValueError('Product ID must be alphanumeric with underscores/hyphens')
-        return v
-
 
 class CampaignBrief(BaseModel):
     """Complete campaign specification."""
+    # Filesystem-safe, enforced by the compiled Field pattern alone
     campaign_id: str = Field(..., pattern=r'^[a-z0-9_]+$')
     region: str
     target_audience: str
@@ -53,14 +48,6 @@ class CampaignBrief(BaseModel):
     locales: List[str] = Field(default_factory=lambda: ["en"], min_length=1)
     products: List[Product] = Field(..., min_length=1, max_length=10)
 
-    @field_validator('campaign_id')
-    @classmethod
-    def validate_campaign_id(cls, v: str) -> str:
-        """Ensure campaign ID is filesystem-safe."""
-        if not v.replace('_', '').replace('-', '').isalnum():
-            raise ValueError('Campaign ID must be alphanumeric with underscores/hyphens')
-        return v
-
 
 class ValidationResult(BaseModel):
     """Result of pre-flight campaign validation."""
@@ -0,0 +1,23 @@
+"""Shared OpenAI client and HTTP session singletons.
+
+ImageGenerator and GovernanceEngine each used to build a private client
+(and httpx connection pool); sharing one per API key amortizes the TLS
+setup across components and keeps connections warm for batch runs.
+"""
+
+from functools import lru_cache
+
+import requests
+from openai import OpenAI
+
+
+@lru_cache(maxsize=4)
+def get_openai_client(api_key: str) -> OpenAI:
+    """Return the process-wide OpenAI client for an API key."""
+    return OpenAI(api_key=api_key)
+
+
+@lru_cache(maxsize=1)
+def get_http_session() -> requests.Session:
+    """Return the process-wide requests session (HTTP keep-alive)."""
+    return requests.Session()
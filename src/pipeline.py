@@ -1,7 +1,9 @@
 """Main pipeline orchestrator for Prism campaign processing."""
 
+import asyncio
 import time
 import json
+import numpy as np
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, Any, List, Tuple
 from pathlib import Path
@@ -26,8 +28,13 @@ class CampaignPipeline:
         """Initialize pipeline with configuration."""
         self.config = config
         
+        # Rate limiter, shared with the generator so response headers can
+        # drive pacing off the server's actual remaining budget
+        generator_config = config.get('generator', {})
+        self.rate_limiter = RateLimiter(generator_config.get('rate_limit', 45))
+
         # Initialize components
-        self.image_generator = ImageGenerator(config)
+        self.image_generator = ImageGenerator(config, rate_limiter=self.rate_limiter)
         self.aspect_processor = AspectRatioProcessor(config)
         self.localizer = Localizer(config)
         self.compositor = AssetCompositor(config)
@@ -36,16 +43,15 @@ class CampaignPipeline:
         
         # Initialize storage
         storage_config = config.get('storage', {}).get('local', {})
-        cache_storage = LocalStorage(storage_config.get('cache_base', './cache'))
-        output_storage = LocalStorage(storage_config.get('output_base', './output'))
+        png_level = storage_config.get('png_compress_level', 1)
+        cache_storage = LocalStorage(storage_config.get('cache_base', './cache'),
+                                     png_compress_level=png_level)
+        output_storage = LocalStorage(storage_config.get('output_base', './output'),
+                                      png_compress_level=png_level)
         
         self.asset_manager = AssetManager(config, self.image_generator, cache_storage)
         self.output_storage = output_storage
         
-        # Rate limiter
-        generator_config = config.get('generator', {})
-        self.rate_limiter = RateLimiter(generator_config.get('rate_limit', 45))
-        
         # Aspect ratios from config
         self.aspect_ratios = [
             AspectRatio(ratio) for ratio in config.get('campaign', {}).get('aspect_ratios', ['1:1', '9:16', '16:9'])
@@ -53,7 +59,26 @@ class CampaignPipeline:
         
         # Worker configuration
         self.max_workers = config.get('scalability', {}).get('max_workers', 3)
-    
+
+        # One persistent worker pool per pipeline instance: repeat runs
+        # (cache-verification passes, Streamlit reruns against a kept
+        # pipeline) reuse warm threads instead of spawning and joining a
+        # fresh pool per run
+        self._io_pool = ThreadPoolExecutor(max_workers=self.max_workers,
+                                           thread_name_prefix='prism-io')
+
+    def close(self):
+        """Shut down the worker pool, waiting for in-flight products."""
+        self._io_pool.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+
     def run(self, brief: CampaignBrief) -> ExecutionReport:
         """
         Run the campaign pipeline in 3 phases:
@@ -86,18 +111,23 @@ class CampaignPipeline:
         
         with ExecutionContext(brief.campaign_id) as ctx:
             ctx.products_count = len(brief.products)
-            
-            # PHASE 1: Get/Generate Hero Images (expensive operations)
-            print(f"\n🎨 Phase 1: Getting/generating hero images for {len(brief.products)} product(s)...")
-            heroes = self._get_heroes(brief, ctx)
-            
-            # PHASE 2: Create Aspect Ratio Variations (local processing)
-            print(f"\n✂️  Phase 2: Creating aspect ratio variations...")
-            variants = self._create_all_variations(heroes, ctx)
-            
-            # PHASE 3: Compose, Localize, and Validate (parallel)
-            print(f"\n🎭 Phase 3: Composing with text/logo and validating...")
-            results = self._compose_all_assets(variants, brief, ctx)
+
+            # Streamed pipeline: each product flows hero → variations →
+            # compose end-to-end on its worker, so the CPU-bound resize
+            # and compose work for finished heroes overlaps the 10-30s
+            # API waits of the ones still generating, instead of every
+            # product idling at hard phase barriers.
+            print(f"\n🚀 Processing {len(brief.products)} product(s) "
+                  f"through the streamed hero → variations → compose pipeline...")
+
+            # Warm translations up-front: one batched call per locale,
+            # all locales in flight concurrently on the event loop,
+            # instead of per-asset round trips inside the workers
+            asyncio.run(self.localizer.prebuild_cache_async(
+                [brief.campaign_message], brief.locales
+            ))
+
+            results = self._process_products(brief, ctx)
             
             # Generate execution report with compliance summary
             report_data = ctx.get_report()
@@ -124,58 +154,101 @@ class CampaignPipeline:
             
             return report
     
-    def _get_heroes(self, brief: CampaignBrief, ctx: ExecutionContext) -> Dict[str, Image.Image]:
+    def _process_products(self, brief: CampaignBrief,
+                          ctx: ExecutionContext) -> List[GeneratedAsset]:
         """
-        Phase 1: Get or generate hero images for all products.
-        
+        Run every product through hero → variations → compose.
+
+        Products are independent, so each streams end-to-end on its own
+        worker; wall time approaches max(product) instead of
+        sum-of-phases across the campaign.
+
         Returns:
-            Dictionary mapping product_id to post-processed hero image
+            List of GeneratedAsset objects for all products
         """
-        heroes = {}
-        
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            futures = {
-                executor.submit(self._get_or_generate_hero, product, brief, ctx): product.id
-                for product in brief.products
-            }
-            
-            for future in as_completed(futures):
-                product_id = futures[future]
+        results = []
+
+        # In-flight state is one future per product — compose tasks run
+        # inline on the product's worker — so pending-work memory is
+        # O(products), not the O(products x ratios x locales) future dict
+        # the old per-asset submission loop materialized up front.
+        futures = {
+            self._io_pool.submit(self._process_product, product, brief, ctx): product.id
+            for product in brief.products
+        }
+
+        for future in as_completed(futures):
+            product_id = futures[future]
+            try:
+                results.extend(future.result())
+            except Exception as e:
+                error_msg = f"Failed to process {product_id}: {e}"
+                ctx.record_error(error_msg)
+                print(f"❌ {error_msg}")
+
+        return results
+
+    def _process_product(self, product, brief: CampaignBrief,
+                         ctx: ExecutionContext) -> List[GeneratedAsset]:
+        """Hero, variations and all composed assets for one product."""
+        hero, is_cached, cost = self._get_or_generate_hero(product, brief, ctx)
+
+        # Track hero metrics
+        if is_cached:
+            ctx.hero_images_cached += 1
+        else:
+            ctx.hero_images_generated += 1
+            ctx.record_cost(cost)
+
+        # Variations stay per-ratio arrays rather than one padded
+        # [ratios, H_max, W_max, 3] stack: the ratios have different
+        # shapes, so padding would triple memory, and nothing consumes
+        # the contiguity — compose wraps each variant for ImageDraw.
+        # PIL images materialize here, at the compose boundary.
+        ratios = [aspect_ratio.value for aspect_ratio in self.aspect_ratios]
+        variant_arrays = self.aspect_processor.create_all_variations_np(hero, ratios)
+        variants = {
+            product.id: {ratio: Image.fromarray(arr) for ratio, arr in variant_arrays.items()}
+        }
+        ctx.variations_created += len(variant_arrays)
+        print(f"   ✓ Created {len(variant_arrays)} variations for {product.id}")
+
+        assets = []
+        for aspect_ratio in self.aspect_ratios:
+            for locale in brief.locales:
                 try:
-                    hero_image, is_cached, cost = future.result()
-                    heroes[product_id] = hero_image
-                    
-                    # Track metrics
-                    if is_cached:
-                        ctx.hero_images_cached += 1
-                    else:
-                        ctx.hero_images_generated += 1
-                        ctx.record_cost(cost)
-                    
+                    result = self._compose_asset(
+                        product, aspect_ratio, locale, brief, variants, ctx
+                    )
+                    if result:
+                        assets.append(result)
                 except Exception as e:
-                    error_msg = f"Failed to get hero for {product_id}: {e}"
+                    error_msg = f"Failed to compose {product.id}_{aspect_ratio.value}_{locale}: {e}"
                     ctx.record_error(error_msg)
                     print(f"❌ {error_msg}")
-        
-        return heroes
-    
-    def _get_or_generate_hero(self, product, brief: CampaignBrief, ctx: ExecutionContext) -> Tuple[Image.Image, bool, float]:
+
+        return assets
+
+    def _get_or_generate_hero(self, product, brief: CampaignBrief, ctx: ExecutionContext) -> Tuple[np.ndarray, bool, float]:
         """
         Get or generate a hero image for a product.
-        
+
         Returns:
-            Tuple of (post-processed hero image, is_cached, cost)
+            Tuple of (post-processed hero array, is_cached, cost)
         """
         # Rate limit for API calls
         self.rate_limiter.acquire()
-        
+
         # Get or generate base hero image
         hero_image, is_cached, cost = self.asset_manager.get_or_generate_hero(
             product, brief
         )
-        
-        # Apply post-processing to hero (film-like effects)
-        processed_hero = self.post_processor.process(hero_image)
+
+        # Apply post-processing to hero (film-like effects). The hero
+        # stays a numpy array from here through Phase 2 — the post
+        # processor and aspect processor both work in the array domain,
+        # so no PIL image is rebuilt between phases
+        processed_hero = self.post_processor.process_array(hero_image)
         
         if is_cached:
             print(f"   ✓ Hero cache HIT for {product.id}")
@@ -184,66 +257,6 @@ class CampaignPipeline:
         
         return processed_hero, is_cached, cost
     
-    def _create_all_variations(self, heroes: Dict[str, Image.Image], 
-                               ctx: ExecutionContext) -> Dict[str, Dict[str, Image.Image]]:
-        """
-        Phase 2: Create aspect ratio variations from hero images.
-        
-        Returns:
-            Nested dict: {product_id: {aspect_ratio: image}}
-        """
-        variants = {}
-        
-        for product_id, hero in heroes.items():
-            variants[product_id] = {}
-            for aspect_ratio in self.aspect_ratios:
-                variant = self.aspect_processor.create_variation(hero, aspect_ratio.value)
-                variants[product_id][aspect_ratio.value] = variant
-                ctx.variations_created += 1
-            
-            print(f"   ✓ Created {len(self.aspect_ratios)} variations for {product_id}")
-        
-        return variants
-    
-    def _compose_all_assets(self, variants: Dict[str, Dict[str, Image.Image]], 
-                           brief: CampaignBrief, ctx: ExecutionContext) -> List[GeneratedAsset]:
-        """
-        Phase 3: Compose all assets with text/logo and validate.
-        
-        Returns:
-            List of GeneratedAsset objects
-        """
-        # Build tasks list
-        tasks = []
-        for product in brief.products:
-            if product.id not in variants:
-                continue
-            for aspect_ratio in self.aspect_ratios:
-                for locale in brief.locales:
-                    tasks.append((product, aspect_ratio, locale, brief, variants))
-        
-        # Process in parallel
-        results = []
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            futures = {
-                executor.submit(self._compose_asset, product, ratio, locale, brief, variants, ctx): 
-                (product.id, ratio.value, locale)
-                for product, ratio, locale, brief, variants in tasks
-            }
-            
-            for future in as_completed(futures):
-                product_id, aspect_ratio, locale = futures[future]
-                try:
-                    result = future.result()
-                    if result:
-                        results.append(result)
-                except Exception as e:
-                    error_msg = f"Failed to compose {product_id}_{aspect_ratio}_{locale}: {e}"
-                    ctx.record_error(error_msg)
-                    print(f"❌ {error_msg}")
-        
-        return results
-    
     def _compose_asset(self, product, aspect_ratio: AspectRatio, locale: str,
                       brief: CampaignBrief, variants: Dict[str, Dict[str, Image.Image]], 
                       ctx: ExecutionContext) -> GeneratedAsset:
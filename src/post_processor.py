@@ -2,7 +2,22 @@
 
 import numpy as np
 from PIL import Image, ImageEnhance, ImageFilter
-from typing import Dict, Any
+from typing import Dict, Any, Union
+
+from src.post_processor_kernels import apply_film
+
+# cv2 keeps the sharpen step in the array domain; PIL round-trip otherwise
+try:
+    import cv2
+    _HAS_CV2 = True
+except ImportError:
+    cv2 = None
+    _HAS_CV2 = False
+
+# Pillow's SMOOTH kernel — used so the cv2 sharpen matches ImageEnhance
+_SMOOTH_KERNEL = np.array(
+    [[1, 1, 1], [1, 5, 1], [1, 1, 1]], dtype=np.float32
+) / 13.0
 
 
 class PostProcessor:
@@ -14,96 +29,126 @@ class PostProcessor:
         self.post_config = config.get('post_processing', {})
         self.enabled = self.post_config.get('enabled', True)
         self.intensity = self.post_config.get('intensity', 0.3)  # 0.0 to 1.0
+        # PCG64 Generator: ~3x faster at bulk Gaussian draws than the
+        # legacy global Mersenne Twister, and draws float32 directly
+        # instead of float64 that we immediately downcast
+        self.rng = np.random.default_rng(self.post_config.get('seed'))
+        # Vignette masks by (width, height, intensity): every hero in a
+        # campaign shares the same dimensions, so the O(H*W) ramp/sqrt
+        # build runs once instead of once per image
+        self._vignette_cache: Dict[tuple, np.ndarray] = {}
+
+        # Pay the JIT compile on a 1x1 dummy at init, not on the first hero
+        if apply_film is not None:
+            apply_film(
+                np.zeros((1, 1, 3), np.float32),
+                np.ones((1, 1), np.float32),
+                np.zeros((1, 1, 3), np.float32),
+                0.0
+            )
     
     def process(self, image: Image.Image) -> Image.Image:
         """
         Apply film-like post-processing effects.
-        
+
         Args:
             image: Input PIL Image
-        
+
         Returns:
             Processed image with subtle imperfections
         """
         if not self.enabled:
             return image
-        
-        img = image.copy()
-        
-        # Apply subtle film grain
-        img = self._add_film_grain(img)
-        
-        # Add subtle vignette
-        img = self._add_vignette(img)
-        
-        # Slight color temperature shift
-        img = self._adjust_color_temperature(img)
-        
-        # Subtle sharpness adjustment
-        img = self._adjust_sharpness(img)
-        
-        return img
-    
-    def _add_film_grain(self, img: Image.Image) -> Image.Image:
-        """Add subtle film grain to image."""
-        img_array = np.array(img).astype(float)
-        
-        # Generate noise
-        noise_intensity = 2 * self.intensity  # 0-2% noise
-        noise = np.random.normal(0, noise_intensity, img_array.shape)
-        
-        # Add noise to image
-        img_array = img_array + noise
-        
-        # Clip values to valid range
-        img_array = np.clip(img_array, 0, 255).astype(np.uint8)
-        
-        return Image.fromarray(img_array)
-    
-    def _add_vignette(self, img: Image.Image) -> Image.Image:
-        """Add subtle vignette effect."""
-        width, height = img.size
-        
-        # Create vignette mask
-        x = np.linspace(-1, 1, width)
-        y = np.linspace(-1, 1, height)
-        X, Y = np.meshgrid(x, y)
-        
-        # Radial distance from center
-        radius = np.sqrt(X**2 + Y**2)
-        
-        # Vignette function (subtle)
-        vignette_strength = 0.3 * self.intensity
-        vignette = 1 - vignette_strength * (radius / radius.max())**2
-        vignette = np.clip(vignette, 0, 1)
-        
-        # Apply to RGB channels
-        img_array = np.array(img).astype(float)
-        for i in range(3):  # RGB channels
-            img_array[:, :, i] *= vignette
-        
-        img_array = np.clip(img_array, 0, 255).astype(np.uint8)
-        
-        return Image.fromarray(img_array)
-    
-    def _adjust_color_temperature(self, img: Image.Image) -> Image.Image:
-        """Slight color temperature adjustment for warmth."""
-        img_array = np.array(img).astype(float)
-        
-        # Warm shift (increase red, slight decrease blue)
+        return Image.fromarray(self.process_array(image))
+
+    def process_array(self, image: Union[Image.Image, np.ndarray]) -> np.ndarray:
+        """
+        Array-in/array-out film pass for callers that stay in numpy.
+
+        The pipeline holds heroes as arrays through Phase 2, so skipping
+        the PIL rebuild here saves a full-frame conversion per hero.
+
+        Args:
+            image: Input PIL Image or uint8 HxWx3 array
+
+        Returns:
+            Processed uint8 HxWx3 array
+        """
+        if not self.enabled:
+            return np.asarray(image, dtype=np.uint8)
+
+        # Vignette, warmth and grain fused into one traversal of a single
+        # float32 buffer. The old per-effect methods each did
+        # array → float64 → clip → uint8 → Image, moving the full frame
+        # four-plus times (~100 MB of traffic per 1024² hero); the fused
+        # pass allocates one working array and clips once at the end.
+        # The float32 conversion already copies, so the input image is
+        # never touched — no protective Image.copy() needed.
+        arr = np.asarray(image, dtype=np.float32)
+        height, width = arr.shape[:2]
+
+        vignette = self._vignette_mask(width, height)
         warmth = 0.02 * self.intensity
-        img_array[:, :, 0] = np.clip(img_array[:, :, 0] * (1 + warmth), 0, 255)  # Red
-        img_array[:, :, 2] = np.clip(img_array[:, :, 2] * (1 - warmth/2), 0, 255)  # Blue
-        
-        return Image.fromarray(img_array.astype(np.uint8))
-    
-    def _adjust_sharpness(self, img: Image.Image) -> Image.Image:
-        """Subtle sharpness adjustment."""
-        # Very subtle sharpening (factor 1.0-1.2 range)
+        noise_intensity = 2 * self.intensity  # 0-2% noise
+        noise = self.rng.standard_normal(arr.shape, dtype=np.float32)
+        noise *= noise_intensity
+
+        if apply_film is not None:
+            # One tight multi-threaded loop over the buffer (numba)
+            apply_film(arr, vignette, noise, warmth)
+        else:
+            # Vignette (multiplicative radial falloff)
+            arr *= vignette[:, :, None]
+
+            # Warm shift (increase red, slight decrease blue)
+            arr[:, :, 0] *= 1 + warmth
+            arr[:, :, 2] *= 1 - warmth / 2
+
+            # Film grain
+            arr += noise
+
+            np.clip(arr, 0, 255, out=arr)
+
+        return self._sharpen_array(arr.astype(np.uint8))
+
+    def _sharpen_array(self, arr: np.ndarray) -> np.ndarray:
+        """Subtle sharpening (factor 1.0-1.2 range) in the array domain.
+
+        Matches ImageEnhance.Sharpness — smooth with Pillow's SMOOTH
+        kernel and extrapolate past the original — but runs through
+        cv2's SIMD filter without leaving numpy. Falls back to the PIL
+        enhancer (one round trip) when cv2 is unavailable.
+        """
         sharpness_factor = 1.0 + (0.15 * self.intensity)
-        enhancer = ImageEnhance.Sharpness(img)
-        return enhancer.enhance(sharpness_factor)
-    
+
+        if _HAS_CV2:
+            smooth = cv2.filter2D(arr, -1, _SMOOTH_KERNEL,
+                                  borderType=cv2.BORDER_REPLICATE)
+            return cv2.addWeighted(arr, sharpness_factor,
+                                   smooth, 1 - sharpness_factor, 0)
+
+        img = ImageEnhance.Sharpness(Image.fromarray(arr)).enhance(sharpness_factor)
+        return np.asarray(img)
+
+    def _vignette_mask(self, width: int, height: int) -> np.ndarray:
+        """Radial vignette multiplier as a float32 HxW array, memoized."""
+        key = (width, height, self.intensity)
+        vignette = self._vignette_cache.get(key)
+        if vignette is not None:
+            return vignette
+
+        # Broadcasting replaces the meshgrid pair — no X/Y temporaries
+        x = np.linspace(-1, 1, width, dtype=np.float32)
+        y = np.linspace(-1, 1, height, dtype=np.float32)
+        radius = np.sqrt(x[None, :] ** 2 + y[:, None] ** 2)
+
+        vignette_strength = 0.3 * self.intensity
+        vignette = 1 - vignette_strength * (radius / radius.max()) ** 2
+        np.clip(vignette, 0, 1, out=vignette)
+
+        self._vignette_cache[key] = vignette
+        return vignette
+
     def add_chromatic_aberration(self, img: Image.Image, strength: float = 1.0) -> Image.Image:
         """
         Add subtle chromatic aberration (optional, more intense effect).
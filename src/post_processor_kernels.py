@@ -0,0 +1,37 @@
+"""Optional Numba-compiled pixel kernels for post-processing.
+
+The fused film pass is an embarrassingly parallel per-pixel loop; when
+numba is installed it runs as a multi-threaded JIT kernel that applies
+vignette, warmth, grain and the clip in one pass over the buffer using
+all cores. Without numba, PostProcessor keeps its vectorized numpy path
+(apply_film is None).
+"""
+
+import numpy as np
+
+try:
+    import numba
+    _HAS_NUMBA = True
+except ImportError:
+    numba = None
+    _HAS_NUMBA = False
+
+
+if _HAS_NUMBA:
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def apply_film(arr, vignette, noise, warmth):  # pragma: no cover - needs numba
+        """Vignette + warmth + grain + clip, in place over float32 HxWx3."""
+        height, width, _ = arr.shape
+        red_scale = 1.0 + warmth
+        blue_scale = 1.0 - warmth / 2.0
+        for i in numba.prange(height):
+            for j in range(width):
+                v = vignette[i, j]
+                r = arr[i, j, 0] * v * red_scale + noise[i, j, 0]
+                g = arr[i, j, 1] * v + noise[i, j, 1]
+                b = arr[i, j, 2] * v * blue_scale + noise[i, j, 2]
+                arr[i, j, 0] = min(max(r, 0.0), 255.0)
+                arr[i, j, 1] = min(max(g, 0.0), 255.0)
+                arr[i, j, 2] = min(max(b, 0.0), 255.0)
+else:
+    apply_film = None
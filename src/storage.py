@@ -31,32 +31,63 @@ class StorageBackend(ABC):
 class LocalStorage(StorageBackend):
     """Local filesystem storage implementation."""
     
-    def __init__(self, base_path: str):
-        """Initialize local storage with base path."""
+    def __init__(self, base_path: str, png_compress_level: int = 1):
+        """Initialize local storage with base path.
+
+        Args:
+            base_path: Root directory for stored assets
+            png_compress_level: zlib level for PNG writes (0-9). The
+                default of 1 encodes several times faster than Pillow's
+                default 6 for a few percent larger files — PNG encode is
+                CPU-bound and runs inside the compose workers
+        """
         self.base_path = Path(base_path)
+        self.png_compress_level = png_compress_level
+        # Directories already created this run: campaigns save thousands
+        # of assets into a handful of folders, so one makedirs per folder
+        # replaces one per file
+        self._known_dirs: set = set()
         ensure_dir(str(self.base_path))
-    
+        self._known_dirs.add(os.fspath(self.base_path))
+
     def save(self, path: str, image: Image.Image) -> str:
-        """Save image to local filesystem."""
+        """Save image to local filesystem, format chosen by extension."""
         full_path = self.base_path / path
-        ensure_dir(str(full_path.parent))
-        image.save(str(full_path), format='PNG')
+        dir_str = os.fspath(full_path.parent)
+        if dir_str not in self._known_dirs:
+            os.makedirs(dir_str, exist_ok=True)
+            self._known_dirs.add(dir_str)
+        if full_path.suffix == '.webp':
+            # SIMD WebP encode: ~10x smaller files and ~3x faster decode
+            # than PNG at hero resolution
+            image.save(str(full_path), format='WEBP', quality=92, method=4)
+        else:
+            image.save(str(full_path), format='PNG',
+                       compress_level=self.png_compress_level, optimize=False)
         return str(full_path)
     
     def load(self, path: str) -> Optional[Image.Image]:
-        """Load image from local filesystem."""
-        full_path = self.base_path / path
-        if not full_path.exists():
+        """Load image from local filesystem.
+
+        Returns a lazy handle — pixels decode on first access and no
+        defensive copy is made. Callers treat cached heroes as read-only,
+        which keeps cache hits free of a full-resolution pixel copy.
+        """
+        full_path = os.fspath(self.base_path / path)
+        if not os.path.lexists(full_path):
             return None
         try:
-            return Image.open(str(full_path))
+            # save() only ever writes PNG or WebP, so restrict the format
+            # probe to those two decoders instead of Pillow trying every
+            # registered plugin against the header
+            return Image.open(full_path, formats=('PNG', 'WEBP'))
         except Exception:
             return None
-    
+
     def exists(self, path: str) -> bool:
         """Check if file exists in local filesystem."""
-        full_path = self.base_path / path
-        return full_path.exists()
+        # os.path.lexists skips the Path.stat wrapper and exception dance
+        return os.path.lexists(os.fspath(self.base_path / path))
 
 
 class AzureBlobStorage(StorageBackend):
@@ -3,43 +3,88 @@
 import os
 import re
 import yaml
+import array
 import json
 import time
+import threading
+
+# libyaml's C scanner/parser loads YAML 2-3x faster than the pure-Python
+# SafeLoader; PyYAML builds without libyaml fall back transparently.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+from functools import lru_cache
 from typing import Dict, Any, Optional
 from pathlib import Path
 from dotenv import load_dotenv
 from contextlib import contextmanager
 
+# orjson is a native JSON codec several times faster than the stdlib
+# tokenizer on both parse and dump; fall back to stdlib json if missing.
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    orjson = None
+    _HAS_ORJSON = False
+
 # Load environment variables
 load_dotenv()
 
 
+# ${VAR} environment interpolation pattern, compiled once at import
+_ENV_RE = re.compile(r'\$\{([^}]+)\}')
+
+
+# Parsed configs keyed by (path, mtime_ns): repeated Config.load calls
+# within a run skip the read + env substitution + YAML parse, and edits
+# to the file still invalidate naturally.
+_CFG_CACHE: Dict[tuple, Dict[str, Any]] = {}
+
+
+@lru_cache(maxsize=512)
+def _split_key_path(key_path: str) -> tuple:
+    """Split a dotted config path once per distinct path string."""
+    return tuple(key_path.split('.'))
+
+
 class Config:
     """Load and validate configuration from YAML with environment variable interpolation."""
-    
+
     @staticmethod
     def load(config_path: str = "config.yaml") -> Dict[str, Any]:
-        """Load configuration from YAML file with environment variable substitution."""
+        """Load configuration from YAML file with environment variable substitution.
+
+        The parsed dict is cached by file mtime and shared between
+        callers; treat it as read-only.
+        """
+        cache_key = (config_path, os.stat(config_path).st_mtime_ns)
+        cached = _CFG_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+
         with open(config_path, 'r') as f:
             content = f.read()
-        
-        # Replace ${VAR} with environment variables
+
+        # Replace ${VAR} with environment variables; the substring probe
+        # skips the regex pass entirely for configs with no placeholders
         def replace_env(match):
             var_name = match.group(1)
             return os.getenv(var_name, match.group(0))
-        
-        pattern = r'\$\{([^}]+)\}'
-        content = re.sub(pattern, replace_env, content)
-        
-        config = yaml.safe_load(content)
+
+        if '${' in content:
+            content = _ENV_RE.sub(replace_env, content)
+
+        config = yaml.load(content, Loader=_YamlLoader)
+        _CFG_CACHE[cache_key] = config
         return config
-    
+
     @staticmethod
     def get(config: Dict[str, Any], key_path: str, default: Any = None) -> Any:
         """Get nested config value using dot notation (e.g., 'generator.model')."""
-        keys = key_path.split('.')
         value = config
-        for key in keys:
+        for key in _split_key_path(key_path):
             if isinstance(value, dict) and key in value:
                 value = value[key]
             else:
@@ -54,7 +99,12 @@ class ExecutionContext:
         self.campaign_id = campaign_id
         self.start_time: Optional[float] = None
         self.end_time: Optional[float] = None
-        self.costs: list[float] = []
+        # Per-transaction trail kept for debugging — array('d') stores
+        # unboxed doubles (8 bytes/entry vs ~32 for a list of floats)
+        # and exposes the buffer protocol for numpy analysis. Totals
+        # come from the running accumulator so report queries are O(1)
+        self.costs = array.array('d')
+        self._total_cost: float = 0.0
         self.timings: Dict[str, float] = {}
         self.errors: list[str] = []
         self.assets_generated = 0
@@ -67,11 +117,13 @@ class ExecutionContext:
         self.variations_created = 0
     
     def __enter__(self):
-        self.start_time = time.time()
+        # Monotonic clock: durations stay correct across wall-clock
+        # adjustments, and reads are a cheap vDSO call on Linux
+        self.start_time = time.monotonic()
         return self
-    
+
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self.end_time = time.time()
+        self.end_time = time.monotonic()
         if self.start_time and self.end_time:
             self.timings['total_execution'] = self.end_time - self.start_time
         return False
@@ -79,13 +131,15 @@ class ExecutionContext:
     def record_cost(self, amount: float):
         """Record a cost transaction."""
         self.costs.append(amount)
+        self._total_cost += amount
     
     def record_timing(self, operation: str, duration: float):
         """Record timing for an operation."""
         self.timings[operation] = duration
-        
-        # Aggregate by stage
-        stage = operation.split('_')[0] if '_' in operation else operation
+
+        # Aggregate by stage; partition returns the prefix in one C call
+        # without allocating a split list (or the whole name if no '_')
+        stage = operation.partition('_')[0]
         self.stage_timings[stage] = self.stage_timings.get(stage, 0) + duration
     
     def record_error(self, error: str):
@@ -94,7 +148,7 @@ class ExecutionContext:
     
     def get_total_cost(self) -> float:
         """Get total cost across all transactions."""
-        return sum(self.costs)
+        return self._total_cost
     
     def get_report(self) -> Dict[str, Any]:
         """Generate execution report."""
@@ -107,7 +161,7 @@ class ExecutionContext:
         if self.start_time and self.end_time:
             execution_time = self.end_time - self.start_time
         elif self.start_time:
-            execution_time = time.time() - self.start_time
+            execution_time = time.monotonic() - self.start_time
         
         # Merge detailed and stage timings
         all_timings = {**self.timings, 'stage_timings': self.stage_timings}
@@ -130,31 +184,74 @@ class ExecutionContext:
 
 
 class RateLimiter:
-    """Token bucket rate limiter for API calls."""
-    
-    def __init__(self, max_per_minute: int):
+    """Token bucket rate limiter for API calls.
+
+    When the API's rate-limit response headers have been fed in via
+    update(), pacing follows the server's own remaining-request count and
+    only sleeps near exhaustion; the local token bucket is the fallback
+    for the first call and for responses without headers.
+    """
+
+    def __init__(self, max_per_minute: int, safety_margin: int = 2):
         self.max_per_minute = max_per_minute
-        self.tokens = max_per_minute
-        self.last_refill = time.time()
+        self.tokens = float(max_per_minute)
+        self.last_refill = time.monotonic()
         self.refill_rate = max_per_minute / 60.0  # tokens per second
-    
+        self.safety_margin = safety_margin
+        self.remaining: Optional[int] = None
+        self.reset_at: Optional[float] = None
+        # Multiple pipeline workers acquire concurrently; the lock keeps
+        # refill arithmetic consistent (and intentionally serializes
+        # callers while the budget is exhausted)
+        self._lock = threading.Lock()
+
+    def update(self, remaining_requests: Optional[int] = None,
+               reset_seconds: Optional[float] = None):
+        """Record the server-reported budget from response headers."""
+        with self._lock:
+            if remaining_requests is not None:
+                self.remaining = remaining_requests
+            if reset_seconds is not None:
+                self.reset_at = time.monotonic() + reset_seconds
+
     def acquire(self):
-        """Acquire a token, blocking if necessary."""
-        now = time.time()
-        elapsed = now - self.last_refill
-        
-        # Refill tokens
-        self.tokens = min(self.max_per_minute, self.tokens + elapsed * self.refill_rate)
-        self.last_refill = now
-        
-        # Wait if no tokens available
-        if self.tokens < 1:
-            wait_time = (1 - self.tokens) / self.refill_rate
-            time.sleep(wait_time)
-            self.tokens = 0
-        else:
+        """Acquire a request slot, blocking only when the budget is spent."""
+        with self._lock:
+            # Server-reported budget wins over the local estimate: no
+            # sleep while the API says plenty of requests remain
+            if self.remaining is not None:
+                if self.remaining > self.safety_margin:
+                    self.remaining -= 1
+                    return
+                if self.reset_at is not None:
+                    wait_time = self.reset_at - time.monotonic()
+                    if wait_time > 0:
+                        time.sleep(wait_time)
+                    # Window rolled over; the next response re-seeds it
+                    self.remaining = None
+                    self.reset_at = None
+                    return
+                # Near exhaustion, no reset info: fall back to the bucket
+
+            self._refill()
+
+            if self.tokens < 1:
+                time.sleep((1 - self.tokens) / self.refill_rate)
+                # Re-refill from the clock rather than zeroing the
+                # bucket: credit accrued during the sleep (and any
+                # oversleep) is kept, so the realized rate tracks the
+                # configured one instead of drifting low
+                self._refill()
+
             self.tokens -= 1
 
+    def _refill(self):
+        """Accrue tokens for the time elapsed since the last refill."""
+        now = time.monotonic()
+        self.tokens = min(float(self.max_per_minute),
+                          self.tokens + (now - self.last_refill) * self.refill_rate)
+        self.last_refill = now
+
 
 def ensure_dir(path: str):
     """Ensure directory exists, creating if necessary."""
@@ -163,13 +260,34 @@ def ensure_dir(path: str):
 
 def load_json(path: str) -> Dict[str, Any]:
     """Load JSON file."""
+    if _HAS_ORJSON:
+        return orjson.loads(Path(path).read_bytes())
     with open(path, 'r') as f:
         return json.load(f)
 
 
+def _json_default(obj: Any) -> Any:
+    """Fallback encoder for types orjson/json don't handle natively."""
+    if hasattr(obj, 'model_dump'):
+        return obj.model_dump()
+    return str(obj)
+
+
 def save_json(data: Dict[str, Any], path: str):
-    """Save data to JSON file."""
+    """Save data to JSON file.
+
+    numpy scalars/arrays serialize natively under orjson and pydantic
+    models fall back to model_dump, so execution reports and cache
+    payloads dump in one native-code pass without pre-conversion.
+    """
     ensure_dir(os.path.dirname(path))
-    with open(path, 'w') as f:
-        json.dump(data, f, indent=2)
+    if _HAS_ORJSON:
+        Path(path).write_bytes(orjson.dumps(
+            data,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_INDENT_2,
+            default=_json_default
+        ))
+    else:
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2, default=_json_default)
 
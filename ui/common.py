@@ -0,0 +1,49 @@
+"""Shared helpers used by the Streamlit entry point and page modules."""
+
+import os
+from functools import lru_cache
+
+import streamlit as st
+from dotenv import load_dotenv
+
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def thumbnail_bytes(path_str: str, mtime: float, width: int = 256) -> bytes:
+    """Downscale an asset once and cache the preview bytes.
+
+    Shipping full-resolution PNGs to the browser for grid thumbnails
+    costs megabytes per rerun; a small server-side preview is enough.
+    Keyed on file mtime so edits invalidate the entry.
+    """
+    import io
+    from PIL import Image
+
+    img = Image.open(path_str)
+    img.thumbnail((width, width))
+    buf = io.BytesIO()
+    img.save(buf, format='PNG', optimize=True)
+    return buf.getvalue()
+
+
+@lru_cache(maxsize=1)
+def api_key_present() -> bool:
+    """Check once per process whether the OpenAI API key is configured.
+
+    The .env file is loaded once by load_dotenv(), so the result is stable
+    across Streamlit reruns. Cached to avoid re-reading the environment on
+    every sidebar rerender.
+    """
+    return bool(os.getenv("OPENAI_API_KEY"))
+
+
+def check_api_key():
+    """Check if OpenAI API key is configured."""
+    if api_key_present():
+        st.sidebar.success("✓ API Key Configured")
+    else:
+        st.sidebar.error("✗ API Key Missing")
+        st.sidebar.warning("Set OPENAI_API_KEY in .env file")
+        if st.sidebar.button("↻ Reload environment", key="reload_env"):
+            load_dotenv(override=True)
+            api_key_present.cache_clear()
+            st.rerun()
@@ -1,90 +1,188 @@
 """Gallery helper functions for asset display and management."""
 
+import os
+import tempfile
 import zipfile
 from pathlib import Path
-from typing import List, Dict, Tuple
-from io import BytesIO
+from typing import IO, List, Dict, Tuple
+
+import streamlit as st
+
+
+def _scan_pngs(directory: str) -> List[Path]:
+    """List the .png files in one directory via a single scandir pass.
+
+    DirEntry carries the name and file type straight from the readdir
+    syscall, so no per-file stat or intermediate PurePath is needed to
+    filter; Path objects are built only for the survivors.
+    """
+    with os.scandir(directory) as it:
+        return sorted(Path(entry.path) for entry in it if entry.name.endswith('.png'))
+
+
+# Directory listings keyed by mtime: Streamlit reruns hit these instead
+# of re-walking the filesystem, and invalidation is exact — POSIX bumps
+# a directory's mtime when entries are added or removed — rather than
+# waiting out the st.cache_data TTL.
+_CAMPAIGN_LIST_CACHE: Dict[str, Tuple[int, List[str]]] = {}
+_CAMPAIGN_ASSET_CACHE: Dict[str, Tuple[tuple, Dict[str, List[Path]]]] = {}
 
 
 def list_campaigns() -> List[str]:
     """Get all campaign IDs from output directory."""
-    output_dir = Path("output")
-    if not output_dir.exists():
+    if not os.path.isdir("output"):
         return []
-    return [d.name for d in output_dir.iterdir() if d.is_dir()]
+    mtime = os.stat("output").st_mtime_ns
+    cached = _CAMPAIGN_LIST_CACHE.get("output")
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    with os.scandir("output") as it:
+        campaigns = [entry.name for entry in it if entry.is_dir()]
+    _CAMPAIGN_LIST_CACHE["output"] = (mtime, campaigns)
+    return campaigns
 
 
 def load_campaign_assets(campaign_id: str) -> Dict[str, List[Path]]:
     """
     Load all assets for a campaign grouped by product.
-    
+
     Returns:
         Dict mapping product_id to list of asset paths
     """
-    campaign_path = Path("output") / campaign_id
-    if not campaign_path.exists():
+    campaign_path = os.path.join("output", campaign_id)
+    if not os.path.isdir(campaign_path):
         return {}
-    
-    assets_by_product = {}
-    for product_dir in campaign_path.iterdir():
-        if product_dir.is_dir():
-            product_id = product_dir.name
-            assets = list(product_dir.glob("*.png"))
-            assets_by_product[product_id] = sorted(assets)
-    
+
+    # New assets land in the product subdirectories, so the cache key
+    # covers each product dir's mtime (from the scandir entries, no
+    # extra stat calls), not just the campaign dir's
+    with os.scandir(campaign_path) as it:
+        product_dirs = [(entry.name, entry.path, entry.stat().st_mtime_ns)
+                        for entry in it if entry.is_dir()]
+    cache_key = tuple(product_dirs)
+    cached = _CAMPAIGN_ASSET_CACHE.get(campaign_path)
+    if cached is not None and cached[0] == cache_key:
+        return cached[1]
+
+    assets_by_product = {
+        name: _scan_pngs(path) for name, path, _ in product_dirs
+    }
+    _CAMPAIGN_ASSET_CACHE[campaign_path] = (cache_key, assets_by_product)
     return assets_by_product
 
 
+# Display order of the known aspect ratios, one bit each
+_RATIO_ORDER = (("1x1", 1), ("9x16", 2), ("16x9", 4))
+_RATIO_BITS = dict(_RATIO_ORDER)
+
+
 def get_asset_info(asset_path: Path) -> Tuple[str, str]:
     """
     Extract aspect ratio and locale from asset filename.
-    
+
     Filename format: {aspect_ratio}_{locale}.png
     Example: 1x1_en.png -> ("1x1", "en")
     """
-    name = asset_path.stem
-    parts = name.split('_')
-    if len(parts) >= 2:
-        aspect_ratio = parts[0]
-        locale = parts[1]
-        return aspect_ratio, locale
+    # partition slices the two fields without allocating a split list
+    aspect_ratio, sep, rest = asset_path.stem.partition('_')
+    if sep:
+        return aspect_ratio, rest.partition('_')[0]
     return "unknown", "unknown"
 
 
-def create_campaign_zip(campaign_id: str) -> BytesIO:
-    """Create ZIP archive of all assets for a campaign."""
-    zip_buffer = BytesIO()
-    campaign_path = Path("output") / campaign_id
-    
-    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-        for product_dir in campaign_path.iterdir():
-            if product_dir.is_dir():
-                for asset in product_dir.glob("*.png"):
-                    # Archive path: {product_id}/{filename}
-                    arcname = f"{product_dir.name}/{asset.name}"
-                    zip_file.write(str(asset), arcname)
+def summarize_assets(assets: List[Path]) -> Tuple[List[str], List[str]]:
+    """
+    Collect the aspect ratios and locales of an asset list in one pass.
+
+    Returns:
+        Tuple of (ratios in display order, sorted locales)
+    """
+    # The ratio universe is fixed at three values, so membership packs
+    # into a bitmask — one dict lookup and an OR per asset, no set to
+    # allocate, and unpacking yields display order for free
+    bits = 0
+    locales = set()
+    for asset in assets:
+        ratio, locale = get_asset_info(asset)
+        bits |= _RATIO_BITS.get(ratio, 0)
+        locales.add(locale)
+    return [r for r, bit in _RATIO_ORDER if bits & bit], sorted(locales)
+
+
+def create_campaign_zip(campaign_id: str) -> IO[bytes]:
+    """Create ZIP archive of all assets for a campaign.
+
+    The archive streams into a spooled temp file: small campaigns stay
+    in memory, multi-GB ones overflow to disk instead of holding every
+    asset byte in a single BytesIO. Returns a file-like object seeked
+    to the start.
+    """
+    zip_buffer = tempfile.SpooledTemporaryFile(max_size=64 * 1024 * 1024)
+    campaign_path = os.path.join("output", campaign_id)
+
+    # ZIP_STORED: the archived PNGs are already zlib-compressed, so a
+    # second DEFLATE pass burns a full zlib traversal per asset for
+    # under 1% size reduction. Should compressible asset types join the
+    # archive, pre-compress them on a thread pool (zlib releases the
+    # GIL) and writestr the ready bytes — the stored-only build is pure
+    # file copy and gains nothing from workers.
+    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_STORED) as zip_file:
+        with os.scandir(campaign_path) as products:
+            for product_dir in products:
+                if not product_dir.is_dir():
+                    continue
+                with os.scandir(product_dir.path) as assets:
+                    for asset in assets:
+                        if not asset.name.endswith('.png'):
+                            continue
+                        # Archive path: {product_id}/{filename}
+                        arcname = f"{product_dir.name}/{asset.name}"
+                        zip_file.write(asset.path, arcname)
     
     zip_buffer.seek(0)
     return zip_buffer
 
 
+@st.cache_data(ttl=60, show_spinner=False)
+def list_campaigns_cached() -> List[str]:
+    """Cached wrapper around list_campaigns for Streamlit reruns."""
+    return list_campaigns()
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def load_campaign_assets_cached(campaign_id: str) -> Dict[str, List[Path]]:
+    """Cached wrapper around load_campaign_assets for Streamlit reruns."""
+    return load_campaign_assets(campaign_id)
+
+
+@st.cache_data(show_spinner=False)
+def campaign_zip_bytes(campaign_id: str, output_mtime: float) -> bytes:
+    """Build the campaign ZIP once per (campaign, output-dir mtime).
+
+    Returns raw bytes rather than a file object so the result is
+    picklable for st.cache_data.
+    """
+    with create_campaign_zip(campaign_id) as spool:
+        return spool.read()
+
+
+def clear_caches():
+    """Invalidate cached listings after new assets are generated."""
+    _CAMPAIGN_LIST_CACHE.clear()
+    _CAMPAIGN_ASSET_CACHE.clear()
+    list_campaigns_cached.clear()
+    load_campaign_assets_cached.clear()
+    campaign_zip_bytes.clear()
+
+
 def get_locales_from_assets(assets: List[Path]) -> List[str]:
     """Extract unique locales from asset list."""
-    locales = set()
-    for asset in assets:
-        _, locale = get_asset_info(asset)
-        locales.add(locale)
-    return sorted(list(locales))
+    return summarize_assets(assets)[1]
 
 
 def get_aspect_ratios_from_assets(assets: List[Path]) -> List[str]:
     """Extract unique aspect ratios from asset list."""
-    ratios = set()
-    for asset in assets:
-        ratio, _ = get_asset_info(asset)
-        ratios.add(ratio)
-    # Return in specific order
-    order = ["1x1", "9x16", "16x9"]
-    return [r for r in order if r in ratios]
+    return summarize_assets(assets)[0]
 
 
@@ -1,8 +1,10 @@
 """Report display and formatting functions."""
 
-import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, List
+from statistics import fmean
+from typing import Dict, Any, List, Tuple
 from datetime import datetime
 import streamlit as st
 
@@ -116,47 +118,100 @@ def display_report_details(report: Dict[str, Any]) -> None:
     # Link to gallery
     if st.button("🖼️ View Assets in Gallery", key=f"view_{report['campaign_id']}"):
         st.session_state.selected_campaign = report['campaign_id']
-        st.session_state.page = "Gallery"
-        st.rerun()
+        st.switch_page("pages/gallery.py")
+
+
+# Decoded reports keyed by the exact (path, mtime) set of log files:
+# the dashboard calls both load_all_reports and the cache-hit average
+# on every rerun, and this single cached pass feeds both instead of two
+# directory walks with duplicate JSON decodes.
+_REPORT_CACHE: Dict[str, Tuple[tuple, List[Dict[str, Any]]]] = {}
+
+
+def _load_reports_cached() -> List[Dict[str, Any]]:
+    """One pass over logs/, cached until any report file changes."""
+    log_dir = "logs"
+    if not os.path.isdir(log_dir):
+        return []
+
+    with os.scandir(log_dir) as it:
+        files = sorted(
+            (entry.path, entry.stat().st_mtime_ns)
+            for entry in it if entry.name.endswith('_execution.json')
+        )
+    cache_key = tuple(files)
+    cached = _REPORT_CACHE.get(log_dir)
+    if cached is not None and cached[0] == cache_key:
+        return cached[1]
+
+    # Cold cache: read the files on a thread pool — the reads release
+    # the GIL and the orjson decode is a short C call, so disk latency
+    # overlaps across files on a dashboard with hundreds of runs
+    if files:
+        with ThreadPoolExecutor(max_workers=min(32, len(files))) as executor:
+            loaded = executor.map(_load_one_report, files)
+        reports = [report for report in loaded if report is not None]
+    else:
+        reports = []
+
+    _REPORT_CACHE[log_dir] = (cache_key, reports)
+    return reports
+
+
+def _load_one_report(entry: Tuple[str, int]) -> Dict[str, Any]:
+    """Decode one report file; None if unreadable or malformed."""
+    from src.utils import load_json
+
+    path, mtime_ns = entry
+    try:
+        report = load_json(path)
+    except Exception:
+        return None
+    report['timestamp'] = mtime_ns / 1e9
+    report['log_file'] = path
+    return report
 
 
 def calculate_avg_cache_hit_rate() -> float:
     """Calculate average cache hit rate across all execution reports."""
-    log_dir = Path("logs")
-    if not log_dir.exists():
-        return 0.0
-    
-    rates = []
-    for log_file in log_dir.glob("*_execution.json"):
-        try:
-            with open(log_file) as f:
-                report = json.load(f)
-                if 'cache_efficiency' in report:
-                    rates.append(report['cache_efficiency'])
-        except Exception:
-            continue
-    
-    return sum(rates) / len(rates) if rates else 0.0
+    rates = [r['cache_efficiency'] for r in _load_reports_cached()
+             if 'cache_efficiency' in r]
+    return fmean(rates) if rates else 0.0
 
 
 def load_all_reports() -> List[Dict[str, Any]]:
     """Load all execution reports from logs directory."""
+    return _load_reports_cached()
+
+
+def logs_mtime() -> float:
+    """Mtime of the logs directory, used as the report cache key."""
     log_dir = Path("logs")
-    if not log_dir.exists():
-        return []
-    
-    reports = []
-    for log_file in log_dir.glob("*_execution.json"):
-        try:
-            with open(log_file) as f:
-                report = json.load(f)
-                report['timestamp'] = log_file.stat().st_mtime
-                report['log_file'] = str(log_file)
-                reports.append(report)
-        except Exception:
-            continue
-    
-    return reports
+    return log_dir.stat().st_mtime if log_dir.exists() else 0.0
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def load_all_reports_cached(mtime: float) -> List[Dict[str, Any]]:
+    """Cached wrapper around load_all_reports for Streamlit reruns.
+
+    Only the pure data loaders are cached — widget-rendering functions
+    must re-execute on every rerun. The logs mtime key invalidates on
+    new runs; clear_caches() is also called on campaign completion.
+    """
+    return load_all_reports()
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def calculate_avg_cache_hit_rate_cached(mtime: float) -> float:
+    """Cached wrapper around calculate_avg_cache_hit_rate."""
+    return calculate_avg_cache_hit_rate()
+
+
+def clear_caches():
+    """Invalidate cached report data after a new campaign run."""
+    _REPORT_CACHE.clear()
+    load_all_reports_cached.clear()
+    calculate_avg_cache_hit_rate_cached.clear()
 
 
 def format_report_timestamp(timestamp: float) -> str:
@@ -1,57 +1,89 @@
 """File upload handling functions."""
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from io import BytesIO
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from PIL import Image
 import streamlit as st
 
 
-def save_input_assets(uploaded_files: List, input_dir: str = "assets/input") -> List[str]:
+def _save_one(uploaded_file, input_path: Path) -> Tuple[Optional[str], Optional[str]]:
+    """Save one uploaded file; returns (saved_path, error_message)."""
+    file_path = input_path / uploaded_file.name
+    try:
+        # Validate with a header-only verify() and write the upload's
+        # bytes through untouched — the old open/save roundtrip fully
+        # decoded and re-encoded every image just to check it was valid
+        data = uploaded_file.getbuffer()
+        Image.open(BytesIO(data)).verify()
+        file_path.write_bytes(data)
+        return str(file_path), None
+    except Exception as e:
+        return None, f"Failed to save {uploaded_file.name}: {e}"
+
+
+def save_input_assets(uploaded_files: List, input_dir: str = "assets/input",
+                      max_workers: int = 8) -> List[str]:
     """
     Save uploaded images to assets/input directory.
-    
+
+    Writes run in a thread pool so per-file validation and disk I/O
+    overlap. Errors are reported from the main thread since Streamlit
+    calls are not safe from workers.
+
     Returns:
         List of saved file paths
     """
     input_path = Path(input_dir)
     input_path.mkdir(parents=True, exist_ok=True)
-    
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(lambda f: _save_one(f, input_path), uploaded_files))
+
     saved_paths = []
-    for uploaded_file in uploaded_files:
-        # Save with original filename
-        file_path = input_path / uploaded_file.name
-        
-        try:
-            # Load and save as PIL Image to validate
-            img = Image.open(uploaded_file)
-            img.save(str(file_path))
-            saved_paths.append(str(file_path))
-        except Exception as e:
-            st.error(f"Failed to save {uploaded_file.name}: {e}")
-    
+    for saved_path, error in results:
+        if saved_path:
+            saved_paths.append(saved_path)
+        else:
+            st.error(error)
+
     return saved_paths
 
 
+@lru_cache(maxsize=32)
+def _id_matcher(product_ids: tuple) -> frozenset:
+    """Hashed product-ID set, cached per unique ID tuple across reruns."""
+    return frozenset(product_ids)
+
+
 def validate_asset_naming(filename: str, product_ids: List[str]) -> Optional[str]:
     """
     Check if asset filename matches expected pattern.
-    
+
     Expected patterns:
     - {product_id}.png
     - {product_id}_{aspect_ratio}.png
-    
+
     Returns:
         None if valid, error message if invalid
     """
-    name_without_ext = filename.rsplit('.', 1)[0]
-    
-    # Check if it matches any product ID
-    for product_id in product_ids:
-        if name_without_ext == product_id:
-            return None
-        if name_without_ext.startswith(f"{product_id}_"):
+    id_set = _id_matcher(tuple(product_ids))
+    stem = filename.rsplit('.', 1)[0]
+
+    # Probe the stem and each underscore-boundary prefix against the
+    # hashed set — product IDs may themselves contain underscores, so
+    # walk boundaries from the right. A handful of O(1) lookups replaces
+    # a scan across every product ID per file.
+    while True:
+        if stem in id_set:
             return None
-    
+        cut = stem.rfind('_')
+        if cut == -1:
+            break
+        stem = stem[:cut]
+
     return f"Filename '{filename}' doesn't match any product ID: {', '.join(product_ids)}"
 
 
@@ -60,8 +92,8 @@ def list_existing_assets(input_dir: str = "assets/input") -> List[Path]:
     input_path = Path(input_dir)
     if not input_path.exists():
         return []
-    
-    return sorted(list(input_path.glob("*.png")) + list(input_path.glob("*.jpg")))
+
+    return sorted(p for p in input_path.iterdir() if p.suffix in ('.png', '.jpg'))
 
 
 def delete_asset(asset_path: Path) -> bool: